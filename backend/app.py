@@ -1,4 +1,6 @@
 # backend/app.py
+import os
+
 from flask import Flask
 from backend.routes import register_routes 
 
@@ -6,4 +8,9 @@ app = Flask(__name__)
 register_routes(app)
 
 if __name__ == '__main__':
-    app.run(debug=True)
+    # Development only; deploy with gunicorn (see wsgi.py / Procfile)
+    if os.environ.get('FLASK_DEV'):
+        app.run(debug=True, threaded=True)
+    else:
+        print("Set FLASK_DEV=1 to use the development server, or run: "
+              "gunicorn -k gevent -w 2 --worker-connections 500 --timeout 30 wsgi:application")
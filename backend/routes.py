@@ -1,6 +1,9 @@
 # backend/routes.py
-from flask import jsonify, request
-from backend.utils import fetch_data_from_nse
+import hashlib
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
+from flask import current_app, jsonify, request
 from datetime import datetime
 from nseapi import (
     get_market_status,
@@ -32,191 +35,297 @@ from nseapi import (
     get_unchanged_data,
     get_stocks_traded,
     get_stocks_traded_by_symbol,
+    pop_cache_status,
 )
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_response(obj):
+    """Serialize `obj` to a JSON response, using orjson when it is installed."""
+    if orjson is None:
+        return jsonify(obj)
+    return current_app.response_class(
+        orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS),
+        mimetype="application/json",
+    )
+
+
+_YMD_RE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
+
+
+@lru_cache(maxsize=8192)
+def parse_ymd(value):
+    """Parse a YYYY-MM-DD string without going through datetime.strptime.
+
+    Raises:
+        ValueError: If `value` is not a valid YYYY-MM-DD date.
+    """
+    if not _YMD_RE.fullmatch(value):
+        raise ValueError(f"Invalid date '{value}', expected YYYY-MM-DD")
+    return datetime(int(value[0:4]), int(value[5:7]), int(value[8:10]))
+
+
+def parse_bool(value):
+    """Parse a "true"/"false" query string."""
+    return value.lower() == "true"
+
+
+def parse_fields(value):
+    """Parse a comma-separated field list into a tuple."""
+    return tuple(field.strip() for field in value.split(",") if field.strip())
+
+
+# (rule, name, library call, {kwarg: (query arg, converter, default)})
+ROUTE_TABLE = [
+    ("/market-status", "market-status", get_market_status, {}),
+    ("/stock-quote/<symbol>", "stock-quote", get_stock_quote, {}),
+    (
+        "/option-chain/<symbol>",
+        "option-chain",
+        get_option_chain,
+        {"is_index": ("is_index", parse_bool, False)},
+    ),
+    (
+        "/all-indices",
+        "all-indices",
+        get_all_indices,
+        {
+            "raw": ("raw", parse_bool, False),
+            "fields": ("fields", parse_fields, None),
+        },
+    ),
+    (
+        "/corporate-actions",
+        "corporate-actions",
+        get_corporate_actions,
+        {
+            "segment": ("segment", str, "equities"),
+            "symbol": ("symbol", str, None),
+            "from_date": ("from_date", parse_ymd, None),
+            "to_date": ("to_date", parse_ymd, None),
+        },
+    ),
+    (
+        "/announcements",
+        "announcements",
+        get_announcements,
+        {
+            "index": ("index", str, "equities"),
+            "symbol": ("symbol", str, None),
+            "fno": ("fno", parse_bool, False),
+            "from_date": ("from_date", parse_ymd, None),
+            "to_date": ("to_date", parse_ymd, None),
+        },
+    ),
+    (
+        "/holidays",
+        "holidays",
+        get_holidays,
+        {"holiday_type": ("type", str, "trading")},
+    ),
+    (
+        "/bulk-deals",
+        "bulk-deals",
+        bulk_deals,
+        {
+            "from_date": ("from_date", parse_ymd, None),
+            "to_date": ("to_date", parse_ymd, None),
+        },
+    ),
+    ("/fii-dii-data", "fii-dii-data", get_fii_dii_data, {}),
+    ("/top-gainers", "top-gainers", get_top_gainers, {}),
+    ("/top-losers", "top-losers", get_top_losers, {}),
+    ("/regulatory-status", "regulatory-status", get_regulatory_status, {}),
+    (
+        "/most-active-equities",
+        "most-active-equities",
+        get_most_active_equities,
+        {"index": ("index", str, "volume")},
+    ),
+    (
+        "/most-active-sme",
+        "most-active-sme",
+        get_most_active_sme,
+        {"index": ("index", str, "volume")},
+    ),
+    (
+        "/most-active-etf",
+        "most-active-etf",
+        get_most_active_etf,
+        {"index": ("index", str, "volume")},
+    ),
+    ("/volume-gainers", "volume-gainers", get_volume_gainers, {}),
+    (
+        "/all-indices-performance",
+        "all-indices-performance",
+        get_all_indices_performance,
+        {},
+    ),
+    (
+        "/price-band-hitters",
+        "price-band-hitters",
+        get_price_band_hitters,
+        {
+            "band_type": ("band_type", str, "upper"),
+            "category": ("category", str, "AllSec"),
+        },
+    ),
+    ("/52-week-high", "52-week-high", get_52_week_high, {}),
+    ("/52-week-low", "52-week-low", get_52_week_low, {}),
+    ("/52-week-counts", "52-week-counts", get_52_week_counts, {}),
+    ("/52-week-data/<symbol>", "52-week-data", get_52_week_data_by_symbol, {}),
+    ("/large-deals", "large-deals", get_large_deals, {}),
+    (
+        "/advance-data",
+        "advance-data",
+        get_advance_data,
+        {"symbol": ("symbol", str, None)},
+    ),
+    (
+        "/decline-data",
+        "decline-data",
+        get_decline_data,
+        {"symbol": ("symbol", str, None)},
+    ),
+    (
+        "/unchanged-data",
+        "unchanged-data",
+        get_unchanged_data,
+        {"symbol": ("symbol", str, None)},
+    ),
+    ("/stocks-traded", "stocks-traded", get_stocks_traded, {}),
+    (
+        "/stocks-traded/<symbol>",
+        "stocks-traded-by-symbol",
+        get_stocks_traded_by_symbol,
+        {},
+    ),
+]
+
+_PATH_ARG_RE = re.compile(r"<(?:\w+:)?(\w+)>")
+
+# Route name -> (library call, path args, query schema), used by the /batch endpoint
+ROUTES = {
+    name: (fn, tuple(_PATH_ARG_RE.findall(rule)), schema)
+    for rule, name, fn, schema in ROUTE_TABLE
+}
+
+
+def _collect_args(schema, args):
+    """Read and convert the query args described by a ROUTE_TABLE schema."""
+    kwargs = {}
+    for kwarg, (query_name, convert, default) in schema.items():
+        value = args.get(query_name)
+        kwargs[kwarg] = convert(value) if value else default
+    return kwargs
+
+
+def etagged(view):
+    """Tag a JSON response with a weak ETag and answer If-None-Match with 304."""
+
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        response = view(*args, **kwargs)
+        if response.status_code != 200:
+            return response
+        # blake2b is only used as a cache tag here, not for security
+        digest = hashlib.blake2b(response.get_data(), digest_size=12).hexdigest()
+        response.set_etag(digest, weak=True)
+        response.headers["Cache-Control"] = "public, max-age=5"
+        return response.make_conditional(request)
+
+    return wrapper
+
+
+def _make_handler(fn, schema):
+    """Build a view that forwards path and query args to a library call."""
+
+    @etagged
+    def handler(**path_args):
+        try:
+            kwargs = _collect_args(schema, request.args)
+        except ValueError as e:
+            response = json_response({"error": str(e)})
+            response.status_code = 400
+            return response
+        return json_response(fn(**path_args, **kwargs))
+
+    return handler
+
+
+_batch_executor = ThreadPoolExecutor(max_workers=16)
+
+# Largest /batch request accepted; bigger ones would monopolise the executor
+_MAX_BATCH_ITEMS = 50
+
+
+def _batch_kwargs(route, params):
+    """Convert a batch item's params with the route's path args and query schema.
+
+    Params are keyed and formatted exactly like the GET route's path and query
+    string, e.g. {"symbol": "NIFTY", "is_index": "true"} for option-chain.
+
+    Raises:
+        ValueError: If a param is unknown, missing or not a string.
+    """
+    if not isinstance(params, dict):
+        raise ValueError("params must be a JSON object")
+    _, path_args, schema = ROUTES[route]
+    allowed = set(path_args) | {query_name for query_name, _, _ in schema.values()}
+    unknown = sorted(set(params) - allowed)
+    if unknown:
+        raise ValueError(f"Unknown params for {route}: {', '.join(unknown)}")
+    for name, value in params.items():
+        if not isinstance(value, str):
+            raise ValueError(f"Param '{name}' must be a string")
+    missing = [name for name in path_args if not params.get(name)]
+    if missing:
+        raise ValueError(f"Missing params for {route}: {', '.join(missing)}")
+
+    kwargs = {name: params[name] for name in path_args}
+    kwargs.update(_collect_args(schema, params))
+    return kwargs
+
+
+def _run_batch_item(item):
+    """Dispatch a single {route, params} batch item to its library call."""
+    route = None
+    try:
+        if not isinstance(item, dict):
+            raise ValueError("Expected a {route, params} object")
+        route = item.get("route")
+        if not isinstance(route, str) or route not in ROUTES:
+            raise ValueError(f"Unknown route: {route}")
+        kwargs = _batch_kwargs(route, item.get("params") or {})
+        return {"route": route, "ok": True, "data": ROUTES[route][0](**kwargs)}
+    except Exception as e:
+        return {"route": route, "ok": False, "error": str(e)}
+
 
 def register_routes(app):
-    @app.route("/market-status", methods=["GET"])
-    def market_status():
-        status = get_market_status()
-        return jsonify(status)
-
-    @app.route("/stock-quote/<symbol>", methods=["GET"])
-    def stock_quote(symbol):
-        quote = get_stock_quote(symbol)
-        return jsonify(quote)
-
-    @app.route("/option-chain/<symbol>", methods=["GET"])
-    def option_chain(symbol):
-        is_index = request.args.get(
-            "is_index", default=False, type=lambda v: v.lower() == "true"
-        )
-        chain = get_option_chain(symbol, is_index=is_index)
-        return jsonify(chain)
-
-    @app.route("/all-indices", methods=["GET"])
-    def all_indices():
-        indices = get_all_indices()
-        return jsonify(indices)
-
-    @app.route("/corporate-actions", methods=["GET"])
-    def corporate_actions():
-        segment = request.args.get("segment", default="equities")
-        symbol = request.args.get("symbol", default=None)
-        from_date = request.args.get("from_date", default=None)
-        to_date = request.args.get("to_date", default=None)
-
-        if from_date:
-            from_date = datetime.strptime(from_date, "%Y-%m-%d")
-        if to_date:
-            to_date = datetime.strptime(to_date, "%Y-%m-%d")
-
-        actions = get_corporate_actions(
-            segment=segment, symbol=symbol, from_date=from_date, to_date=to_date
-        )
-        return jsonify(actions)
-
-    @app.route("/announcements", methods=["GET"])
-    def announcements():
-        index = request.args.get("index", default="equities")
-        symbol = request.args.get("symbol", default=None)
-        fno = request.args.get("fno", default=False, type=lambda v: v.lower() == "true")
-        from_date = request.args.get("from_date", default=None)
-        to_date = request.args.get("to_date", default=None)
-
-        if from_date:
-            from_date = datetime.strptime(from_date, "%Y-%m-%d")
-        if to_date:
-            to_date = datetime.strptime(to_date, "%Y-%m-%d")
-
-        announcements = get_announcements(
-            index=index, symbol=symbol, fno=fno, from_date=from_date, to_date=to_date
-        )
-        return jsonify(announcements)
-
-    @app.route("/holidays", methods=["GET"])
-    def holidays():
-        holiday_type = request.args.get("type", default="trading")
-        holidays = get_holidays(holiday_type=holiday_type)
-        return jsonify(holidays)
-
-    @app.route("/bulk-deals", methods=["GET"])
-    def bulk_deals_route():
-        from_date = request.args.get("from_date", default=None)
-        to_date = request.args.get("to_date", default=None)
-
-        if from_date:
-            from_date = datetime.strptime(from_date, "%Y-%m-%d")
-        if to_date:
-            to_date = datetime.strptime(to_date, "%Y-%m-%d")
-
-        deals = bulk_deals(from_date=from_date, to_date=to_date)
-        return jsonify(deals)
-
-    @app.route("/fii-dii-data", methods=["GET"])
-    def fii_dii_data():
-        data = get_fii_dii_data()
-        return jsonify(data)
-
-    @app.route("/top-gainers", methods=["GET"])
-    def top_gainers():
-        gainers = get_top_gainers()
-        return jsonify(gainers)
-
-    @app.route("/top-losers", methods=["GET"])
-    def top_losers():
-        losers = get_top_losers()
-        return jsonify(losers)
-
-    @app.route("/regulatory-status", methods=["GET"])
-    def regulatory_status():
-        status = get_regulatory_status()
-        return jsonify(status)
-
-    @app.route("/most-active-equities", methods=["GET"])
-    def most_active_equities():
-        index = request.args.get("index", default="volume")
-        equities = get_most_active_equities(index=index)
-        return jsonify(equities)
-
-    @app.route("/most-active-sme", methods=["GET"])
-    def most_active_sme():
-        index = request.args.get("index", default="volume")
-        sme = get_most_active_sme(index=index)
-        return jsonify(sme)
-
-    @app.route("/most-active-etf", methods=["GET"])
-    def most_active_etf():
-        index = request.args.get("index", default="volume")
-        etf = get_most_active_etf(index=index)
-        return jsonify(etf)
-
-    @app.route("/volume-gainers", methods=["GET"])
-    def volume_gainers():
-        gainers = get_volume_gainers()
-        return jsonify(gainers)
-
-    @app.route("/all-indices-performance", methods=["GET"])
-    def all_indices_performance():
-        performance = get_all_indices_performance()
-        return jsonify(performance)
-
-    @app.route("/price-band-hitters", methods=["GET"])
-    def price_band_hitters():
-        band_type = request.args.get("band_type", default="upper")
-        category = request.args.get("category", default="AllSec")
-        hitters = get_price_band_hitters(band_type=band_type, category=category)
-        return jsonify(hitters)
-
-    @app.route("/52-week-high", methods=["GET"])
-    def week_high():
-        high = get_52_week_high()
-        return jsonify(high)
-
-    @app.route("/52-week-low", methods=["GET"])
-    def week_low():
-        low = get_52_week_low()
-        return jsonify(low)
-
-    @app.route("/52-week-counts", methods=["GET"])
-    def week_counts():
-        counts = get_52_week_counts()
-        return jsonify(counts)
-
-    @app.route("/52-week-data/<symbol>", methods=["GET"])
-    def week_data(symbol):
-        data = get_52_week_data_by_symbol(symbol)
-        return jsonify(data)
-
-    @app.route("/large-deals", methods=["GET"])
-    def large_deals():
-        deals = get_large_deals()
-        return jsonify(deals)
-
-    @app.route("/advance-data", methods=["GET"])
-    def advance_data():
-        symbol = request.args.get("symbol", default=None)
-        data = get_advance_data(symbol=symbol)
-        return jsonify(data)
-
-    @app.route("/decline-data", methods=["GET"])
-    def decline_data():
-        symbol = request.args.get("symbol", default=None)
-        data = get_decline_data(symbol=symbol)
-        return jsonify(data)
-
-    @app.route("/unchanged-data", methods=["GET"])
-    def unchanged_data():
-        symbol = request.args.get("symbol", default=None)
-        data = get_unchanged_data(symbol=symbol)
-        return jsonify(data)
-
-    @app.route("/stocks-traded", methods=["GET"])
-    def stocks_traded():
-        data = get_stocks_traded()
-        return jsonify(data)
-
-    @app.route("/stocks-traded/<symbol>", methods=["GET"])
-    def stocks_traded_by_symbol(symbol):
-        data = get_stocks_traded_by_symbol(symbol)
-        return jsonify(data)
+    @app.after_request
+    def add_cache_header(response):
+        status = pop_cache_status()
+        if status:
+            response.headers["X-Cache"] = status
+        return response
+
+    @app.route("/batch", methods=["POST"])
+    def batch():
+        items = request.get_json(silent=True)
+        if not isinstance(items, list):
+            return jsonify({"error": "Expected a JSON list of {route, params}"}), 400
+        if len(items) > _MAX_BATCH_ITEMS:
+            return (
+                jsonify({"error": f"At most {_MAX_BATCH_ITEMS} items per batch"}),
+                400,
+            )
+        results = list(_batch_executor.map(_run_batch_item, items))
+        return json_response(results)
+
+    for rule, name, fn, schema in ROUTE_TABLE:
+        app.add_url_rule(rule, name, _make_handler(fn, schema), methods=["GET"])
@@ -1,45 +1,102 @@
 from datetime import datetime, date, timedelta
 from pathlib import Path
 import requests
-import zipfile
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import HTTPError as _Urllib3Error
+from urllib3.util.request import ACCEPT_ENCODING
 import json
 
 import os
+import random
+import re
 import gzip
+import hashlib
 import shutil
-from typing import List, Dict, Literal, Optional, Any, Tuple
-from functools import lru_cache
+from typing import List, Dict, Literal, Optional, Any, Sequence, Tuple
+from collections import OrderedDict
+from functools import lru_cache, partial, wraps
+from concurrent.futures import Future, ThreadPoolExecutor
+from types import MappingProxyType
 import logging
-from time import sleep
+import threading
+from time import sleep, monotonic, time
+from urllib.parse import urlencode
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ISA-L's igzip is a drop-in, SIMD-accelerated replacement for gzip
+try:
+    from isal import igzip as _gzip
+except ImportError:
+    _gzip = gzip
+
+
+class _LazyFileHandler(logging.FileHandler):
+    """FileHandler that creates the log directory and file on the first record.
+
+    Importing the package therefore touches the filesystem only once
+    something is actually logged.
+    """
+
+    def __init__(self, filename):
+        super().__init__(filename, delay=True)
+
+    def _open(self):
+        Path(self.baseFilename).parent.mkdir(parents=True, exist_ok=True)
+        return super()._open()
+
+
 # Set up logging first (needed by rate limiter)
 logger = logging.getLogger("NSEIndia")
 logger.setLevel(logging.INFO)
 logs_dir = Path("logs")
-logs_dir.mkdir(exist_ok=True)
 if not logger.handlers:
-    handler = logging.FileHandler(logs_dir / "nseapi.log")
+    handler = _LazyFileHandler(logs_dir / "nseapi.log")
     handler.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
     logger.addHandler(handler)
 
+
+class NSEAPIError(Exception):
+    """Raised when data cannot be fetched from NSE or the response is unusable.
+
+    The underlying exception (e.g. a requests ConnectionError or Timeout) is
+    kept as ``__cause__``.
+    """
+
+
+# Maximum concurrent requests when a helper fans out over several endpoints
+_MAX_FANOUT_WORKERS = 8
+
 # Rate limiting configuration
 _rate_limit_window = 1.0  # 1 second window
 _rate_limit_max_requests = 3  # 3 requests per second
 _rate_limit_timestamps: List[float] = []
+_rate_limit_lock = threading.RLock()
+
 
 def _check_rate_limit() -> None:
     """Internal function to enforce rate limiting.
 
     Ensures maximum 3 requests per second to prevent API abuse and blocking.
-    Uses a sliding window approach to track request timestamps.
+    Uses a sliding window approach to track request timestamps. Safe to call
+    from several threads at once.
     """
+    with _rate_limit_lock:
+        _check_rate_limit_locked()
+
+
+def _check_rate_limit_locked() -> None:
     global _rate_limit_timestamps
     current_time = datetime.now().timestamp()
 
     # Remove timestamps outside the current window
     _rate_limit_timestamps = [
-        timestamp for timestamp in _rate_limit_timestamps
+        timestamp
+        for timestamp in _rate_limit_timestamps
         if current_time - timestamp < _rate_limit_window
     ]
 
@@ -51,49 +108,442 @@ def _check_rate_limit() -> None:
             logger.info(f"Rate limit reached, sleeping for {sleep_time:.2f} seconds")
             sleep(sleep_time)
             # Recursively call to recalculate after sleep
-            _check_rate_limit()
+            _check_rate_limit_locked()
 
     # Add current timestamp
     _rate_limit_timestamps.append(current_time)
 
-# Initialize a session for all requests
-session = requests.Session()
 
-session.headers.update(
+# Headers sent with every request; set once on the shared session
+_HEADERS = MappingProxyType(
     {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; rv:109.0) Gecko/20100101 Firefox/118.0",
         "Accept": "*/*",
         "Accept-Language": "en-US,en;q=0.5",
-        "Accept-Encoding": "gzip, deflate",
+        # gzip/deflate plus br and zstd when brotli / zstandard are installed,
+        # i.e. exactly the encodings urllib3 can decode here
+        "Accept-Encoding": ACCEPT_ENCODING,
         "Referer": "https://www.nseindia.com/get-quotes/equity?symbol=HDFCBANK",
     }
 )
 
+# Initialize a session for all requests
+session = requests.Session()
+session.headers.update(_HEADERS)
+
+# Keep a larger pool of keep-alive connections. The adapter itself does not
+# retry: _fetch_uncached owns retries, so they go through the rate limiter and
+# its capped Retry-After handling, and a failing call isn't retried twice over.
+_adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=0)
+session.mount("https://", _adapter)
+session.mount("http://", _adapter)
+
 
 # Fetch cookies required for API access
-def _fetch_cookies():
+_COOKIE_TTL = 300  # refresh the NSE session cookies every 5 minutes
+_cookies_fetched_at = 0.0
+_cookie_lock = threading.Lock()
+# Cookies NSE sets on the option-chain page; while all of them are present
+# and unexpired the jar is trusted past _COOKIE_TTL
+_NSE_COOKIES = frozenset({"nsit", "nseappid"})
+# Treat cookies expiring within this many seconds as already expired
+_COOKIE_EXPIRY_MARGIN = 30
+
+
+def _cookies_valid() -> bool:
+    """Check whether the session's cookies can be reused without a refresh."""
+    deadline = time() + _COOKIE_EXPIRY_MARGIN
+    names = set()
+    # Snapshot under the jar's own lock; iterating while another thread's
+    # response sets a cookie can fail with "dictionary changed size"
+    with session.cookies._cookies_lock:
+        cookies = list(session.cookies)
+    for cookie in cookies:
+        if cookie.expires is not None and cookie.expires < deadline:
+            return False
+        names.add(cookie.name)
+    if not names:
+        return False
+    if _NSE_COOKIES <= names:
+        return True
+    return monotonic() - _cookies_fetched_at <= _COOKIE_TTL
+
+
+def _fetch_cookies(force: bool = False):
     """Fetch and return cookies from NSE website for API authentication.
     
     This internal function makes a request to the NSE option-chain page
     to obtain the necessary session cookies required for subsequent API calls.
+    The cookies live on the shared session, so the page is only requested
+    when `force` is set, the jar is empty, a cookie is about to expire, or
+    NSE's auth cookies are missing and the jar is older than `_COOKIE_TTL`.
+
+    Args:
+        force (bool): Refetch even if the cached cookies are still fresh.
     
     Returns:
         requests.cookies.RequestsCookieJar: Session cookies for NSE API access
     """
-    # Get cookies from option-chain page as it sets the required cookies for equity APIs
-    session.get("https://www.nseindia.com/option-chain")
+    global _cookies_fetched_at
+    with _cookie_lock:
+        if force or not _cookies_valid():
+            # Get cookies from option-chain page as it sets the required cookies for equity APIs
+            session.get("https://www.nseindia.com/option-chain", timeout=10)
+            _cookies_fetched_at = monotonic()
     return session.cookies
 
 
-def fetch_data_from_nse(endpoint, params=None, retries=3, delay=2, timeout=10):
+def _decode_json(response):
+    """Decode a JSON response body, using orjson when it is installed."""
+    if orjson is None:
+        return response.json()
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError as e:
+        raise requests.exceptions.JSONDecodeError(e.msg, e.doc, e.pos) from e
+
+
+# Response cache TTLs in seconds: per-endpoint overrides, then the default.
+# Memoized helpers fetch with ttl=0 and don't need an entry here.
+_CACHE_TTLS = {
+    "allIndices": 60,
+}
+_DEFAULT_CACHE_TTL = 5
+
+
+class DictCache:
+    """In-process response cache.
+
+    Entries are kept for twice their TTL: fresh for the first TTL and
+    stale (served while being refreshed) for the second. Values are stored
+    as JSON and decoded per hit, like the other backends, so a caller
+    mutating its result can't change the cache.
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, Tuple[float, float, bytes]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[Tuple[float, Any]]:
+        """Return (fresh_until, value) for a live entry, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time() >= entry[1]:
+                self.misses += 1
+                return None
+            self.hits += 1
+            fresh_until, _, raw = entry
+        return fresh_until, _json_loads(raw)
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        raw = _json_dumps(value)
+        now = time()
+        with self._lock:
+            self._entries[key] = (now + ttl, now + 2 * ttl, raw)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class RedisCache:
+    """Response cache shared between processes through Redis.
+
+    Values are stored as JSON alongside their freshness deadline, and hit
+    and miss totals are counted in the `<prefix>hits` and `<prefix>misses` keys.
+    """
+
+    def __init__(self, client, prefix: str = "nse:"):
+        self._client = client
+        self._prefix = prefix
+
+    def get(self, key: str) -> Optional[Tuple[float, Any]]:
+        """Return (fresh_until, value) for a live entry, or None."""
+        raw = self._client.get(self._prefix + key)
+        self._client.incr(self._prefix + ("hits" if raw else "misses"))
+        if raw is None:
+            return None
+        fresh_until, value = _json_loads(raw)
+        return fresh_until, value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        payload = _json_dumps([time() + ttl, value])
+        self._client.set(self._prefix + key, payload, ex=max(1, int(2 * ttl)))
+
+    def clear(self) -> None:
+        for key in self._client.scan_iter(match=self._prefix + "*"):
+            self._client.delete(key)
+
+
+class FileCache:
+    """Response cache persisted on disk, so it survives process restarts.
+
+    Each entry is a gzipped JSON file named after a hash of its key, holding
+    its freshness and expiry deadlines alongside the value. A file's mtime is
+    set to its expiry, so expired entries can be swept by `stat` alone;
+    expired files are deleted when read and by a sweep every
+    `sweep_interval` seconds of writes.
+    """
+
+    def __init__(self, directory: str = ".nseapi_cache", sweep_interval: float = 300.0):
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._sweep_interval = sweep_interval
+        self._next_sweep = monotonic() + sweep_interval
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key: str) -> Path:
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+        return self._directory / f"{digest}.json.gz"
+
+    def _count(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    @staticmethod
+    def _unlink_expired(path: Path, now: float) -> None:
+        # Re-check the mtime so an entry rewritten meanwhile is kept
+        try:
+            if path.stat().st_mtime <= now:
+                path.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+    def get(self, key: str) -> Optional[Tuple[float, Any]]:
+        """Return (fresh_until, value) for a live entry, or None."""
+        path = self._path(key)
+        try:
+            with _gzip.open(path, "rb") as file:
+                fresh_until, expires_at, value = _json_loads(file.read())
+        except (OSError, ValueError):
+            self._count(hit=False)
+            return None
+        now = time()
+        if now >= expires_at:
+            self._unlink_expired(path, now)
+            self._count(hit=False)
+            return None
+        self._count(hit=True)
+        return fresh_until, value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        import tempfile
+
+        now = time()
+        expires_at = now + 2 * ttl
+        path = self._path(key)
+        # Write under a unique name and swap it in, so readers never see a
+        # partial file and concurrent writers don't interleave
+        fd, part_path = tempfile.mkstemp(dir=self._directory, suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as raw, _gzip.GzipFile(
+                fileobj=raw, mode="wb"
+            ) as file:
+                file.write(_json_dumps([now + ttl, expires_at, value]))
+            os.utime(part_path, (expires_at, expires_at))
+            os.replace(part_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to write cache entry {path}: {e}")
+            Path(part_path).unlink(missing_ok=True)
+        self._maybe_sweep()
+
+    def _maybe_sweep(self) -> None:
+        with self._lock:
+            if monotonic() < self._next_sweep:
+                return
+            self._next_sweep = monotonic() + self._sweep_interval
+        now = time()
+        for path in self._directory.glob("*.json.gz"):
+            self._unlink_expired(path, now)
+
+    def clear(self) -> None:
+        for path in self._directory.glob("*.json.gz"):
+            path.unlink(missing_ok=True)
+
+
+async def _run_in_thread(fn, *args, **kwargs):
+    """Run a blocking call on the default executor so it can be awaited."""
+    # Imported here so plain synchronous users don't pay for asyncio at import
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, partial(fn, *args, **kwargs))
+
+
+def _json_dumps(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _json_loads(raw):
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _make_cache():
+    """Pick the cache backend from the NSEAPI_CACHE environment variable.
+
+    A redis:// (or rediss://) URL selects RedisCache and file://<directory>
+    selects FileCache; anything else, or a missing redis package, falls back
+    to the in-process DictCache.
+    """
+    url = os.environ.get("NSEAPI_CACHE", "")
+    if url.startswith("file://"):
+        return FileCache(url[len("file://") :] or ".nseapi_cache")
+    if url.startswith(("redis://", "rediss://")):
+        try:
+            import redis
+        except ImportError:
+            logger.warning("NSEAPI_CACHE points at Redis but redis is not installed")
+        else:
+            return RedisCache(redis.Redis.from_url(url))
+    return DictCache()
+
+
+_cache = _make_cache()
+_refreshing: set = set()
+_refreshing_lock = threading.Lock()
+# Requests currently being fetched on a cache miss, so concurrent callers
+# for the same key wait for one response instead of each fetching it;
+# maps key -> [future, number of waiters]
+_inflight: Dict[str, List] = {}
+_inflight_lock = threading.Lock()
+_cache_local = threading.local()
+
+
+def _cache_key(endpoint: str, params: Optional[Dict]) -> str:
+    """Build a cache key from an endpoint and its query parameters."""
+    if not params:
+        return endpoint
+    return f"{endpoint}?{urlencode(sorted(params.items()))}"
+
+
+def _refresh_cache_entry(key, endpoint, params, ttl, retries, delay, timeout) -> None:
+    """Refetch a stale cache entry in the background."""
+    try:
+        data = _fetch_uncached(endpoint, params, retries, delay, timeout)
+        _cache.set(key, data, ttl)
+    except requests.RequestException as e:
+        logger.warning(f"Background refresh of {endpoint} failed: {str(e)}")
+    finally:
+        with _refreshing_lock:
+            _refreshing.discard(key)
+
+
+def pop_cache_status() -> Optional[str]:
+    """Return and clear the cache outcome of the last fetch on this thread.
+
+    Returns:
+        Optional[str]: "HIT", "MISS" or "STALE", or None if nothing was fetched.
+    """
+    status = getattr(_cache_local, "status", None)
+    _cache_local.status = None
+    return status
+
+
+def clear_cache() -> None:
+    """Drop every cached API response."""
+    _cache.clear()
+    for entries in _memoized:
+        entries.clear()
+    with _validators_lock:
+        _validators.clear()
+
+
+_memoized: List[Dict] = []
+
+# Argument sets remembered per memoized function, and lock stripes per function
+_MEMO_MAXSIZE = 256
+_MEMO_LOCK_STRIPES = 64
+
+
+def _memoize(ttl: float, maxsize: int = _MEMO_MAXSIZE):
+    """Cache a function's result per argument set for `ttl` seconds.
+
+    Results are kept as JSON for the `maxsize` most recently used argument
+    sets and decoded for every hit, so mutating a result can't corrupt the
+    cache. Concurrent callers that miss the cache for the same arguments
+    wait on a shared lock stripe and share one upstream request instead of
+    each issuing their own.
+
+    Memoized functions fetch with ttl=0, so the memo is their only cache
+    layer and `ttl` bounds how old a returned result can be.
+    """
+
+    def decorator(fn):
+        entries: "OrderedDict[Tuple, Tuple[float, Any]]" = OrderedDict()
+        entries_lock = threading.Lock()
+        # A fixed set of locks keeps memory bounded however many symbols are
+        # queried; keys sharing a stripe only wait on each other's misses
+        stripes = [threading.Lock() for _ in range(_MEMO_LOCK_STRIPES)]
+        _memoized.append(entries)
+
+        def lookup(key):
+            with entries_lock:
+                cached = entries.get(key)
+                if cached is None or monotonic() >= cached[0]:
+                    return None
+                entries.move_to_end(key)
+                return cached
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            try:
+                stripe = stripes[hash(key) % _MEMO_LOCK_STRIPES]
+            except TypeError:
+                # Unhashable arguments (e.g. a list) can't be keyed; skip the cache
+                return fn(*args, **kwargs)
+            cached = lookup(key)
+            if cached is None:
+                with stripe:
+                    cached = lookup(key)
+                    if cached is None:
+                        result = fn(*args, **kwargs)
+                        with entries_lock:
+                            entries[key] = (monotonic() + ttl, _json_dumps(result))
+                            entries.move_to_end(key)
+                            if len(entries) > maxsize:
+                                entries.popitem(last=False)
+                        return result
+            # Report memo hits the same way fetch_data_from_nse reports its own
+            _cache_local.status = "HIT"
+            return _json_loads(cached[1])
+
+        return wrapper
+
+    return decorator
+
+
+def fetch_data_from_nse(
+    endpoint, params=None, retries=3, delay=2, timeout=10, ttl=None
+):
     """Fetch data from a given NSE endpoint with retry logic and caching.
 
+    Responses are cached per (endpoint, params) in the backend chosen by
+    NSEAPI_CACHE (in-process by default, Redis, or a directory on disk).
+    Fresh entries are returned immediately; stale entries (within one extra
+    TTL) are returned while a background thread refreshes them. Concurrent
+    misses for the same key share a single request, even when caching is
+    disabled.
+
     Args:
         endpoint (str): The API endpoint to fetch data from.
         params (dict, optional): Query parameters for the request. Defaults to None.
         retries (int, optional): Number of retry attempts. Defaults to 3.
         delay (int, optional): Delay between retries in seconds. Defaults to 2.
         timeout (int, optional): Timeout for the request in seconds. Defaults to 10.
+        ttl (float, optional): Cache lifetime in seconds. Defaults to the
+            endpoint's entry in `_CACHE_TTLS`; 0 disables caching.
 
     Returns:
         dict: JSON response from the API.
@@ -101,6 +551,128 @@ def fetch_data_from_nse(endpoint, params=None, retries=3, delay=2, timeout=10):
     Raises:
         requests.RequestException: If the request fails after all retries.
     """
+    if ttl is None:
+        ttl = _CACHE_TTLS.get(endpoint, _DEFAULT_CACHE_TTL)
+
+    key = _cache_key(endpoint, params)
+    entry = _cache.get(key) if ttl else None
+    if entry is not None:
+        fresh_until, data = entry
+        if time() < fresh_until:
+            _cache_local.status = "HIT"
+            return data
+        _cache_local.status = "STALE"
+        with _refreshing_lock:
+            if key not in _refreshing:
+                _refreshing.add(key)
+                threading.Thread(
+                    target=_refresh_cache_entry,
+                    args=(key, endpoint, params, ttl, retries, delay, timeout),
+                    daemon=True,
+                ).start()
+        return data
+
+    _cache_local.status = "MISS"
+    with _inflight_lock:
+        inflight = _inflight.get(key)
+        leader = inflight is None
+        if leader:
+            inflight = _inflight[key] = [Future(), 0]
+        else:
+            inflight[1] += 1
+    future = inflight[0]
+    if not leader:
+        # Waiters decode their own copy of the leader's response
+        return _json_loads(future.result())
+
+    try:
+        data = _fetch_uncached(endpoint, params, retries, delay, timeout)
+        if ttl:
+            _cache.set(key, data, ttl)
+        with _inflight_lock:
+            # No new waiters can join once the key is gone
+            _inflight.pop(key, None)
+            waiters = inflight[1]
+        future.set_result(_json_dumps(data) if waiters else None)
+        return data
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _inflight_lock:
+            if _inflight.get(key) is inflight:
+                del _inflight[key]
+
+
+async def afetch_data_from_nse(endpoint, params=None, **kwargs):
+    """Async variant of `fetch_data_from_nse` for use with asyncio.gather.
+
+    Runs the request in a worker thread, so it shares the session cookies,
+    rate limiter and response cache with synchronous callers.
+    """
+    return await _run_in_thread(fetch_data_from_nse, endpoint, params, **kwargs)
+
+
+async def afetch_many(specs: Sequence[Tuple[str, Optional[Dict]]]) -> List[Any]:
+    """Fetch several NSE endpoints concurrently.
+
+    Args:
+        specs: (endpoint, params) pairs, e.g.
+            [("live-analysis-variations", {"index": "gainers"}), ("allIndices", None)].
+
+    Returns:
+        List[Any]: Decoded responses in the same order as `specs`.
+
+    Raises:
+        The first exception raised by any of the requests.
+    """
+    import asyncio
+
+    return list(
+        await asyncio.gather(
+            *(afetch_data_from_nse(endpoint, params) for endpoint, params in specs)
+        )
+    )
+
+
+# Upper bound on a single wait between retries, in seconds
+_MAX_RETRY_DELAY = 30.0
+
+
+def _retry_delay(attempt: int, delay: float, error: Exception) -> float:
+    """Seconds to wait before retrying after a failed attempt.
+
+    Honours the server's Retry-After header (seconds form) when present,
+    otherwise backs off exponentially from `delay` with random jitter so
+    concurrent callers don't retry in lockstep.
+    """
+    response = getattr(error, "response", None)
+    if response is not None:
+        retry_after = response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return min(float(retry_after), _MAX_RETRY_DELAY)
+    return min(delay * 2**attempt + random.uniform(0, delay), _MAX_RETRY_DELAY)
+
+
+# 4xx responses that are not worth retrying; 401/403 (stale cookies),
+# 408 and 429 (throttling) are retried
+_FINAL_CLIENT_ERRORS = frozenset(range(400, 500)) - {401, 403, 408, 429}
+
+
+def _fetch_uncached(
+    endpoint,
+    params=None,
+    retries=3,
+    delay=2,
+    timeout=10,
+    headers=None,
+    parse=_decode_json,
+):
+    """Fetch data from a given NSE endpoint with retry logic, bypassing the cache.
+
+    `headers` are sent with every attempt and `parse` turns the successful
+    response into the return value; both exist for conditional requests.
+    """
     base_url = "https://www.nseindia.com/api"
     url = f"{base_url}/{endpoint}"
 
@@ -111,24 +683,29 @@ def fetch_data_from_nse(endpoint, params=None, retries=3, delay=2, timeout=10):
             # Apply rate limiting before making the request
             _check_rate_limit()
 
-            # Refresh cookies on first attempt or after failure
-            if attempt == 0 or attempt > 0:
-                _fetch_cookies()
+            # Reuse cached cookies, refreshing them after a failed attempt
+            _fetch_cookies(force=attempt > 0)
 
             response = session.get(
                 url,
                 params=params,
+                headers=headers,
                 timeout=timeout,
             )
             response.raise_for_status()
 
             logger.info(f"Successfully fetched data from {endpoint}")
-            return response.json()
+            return parse(response)
             
         except requests.RequestException as e:
             logger.warning(f"Attempt {attempt + 1} failed: {str(e)}")
+            status = e.response.status_code if e.response is not None else None
+            if status in _FINAL_CLIENT_ERRORS:
+                # e.g. 404 for an unknown symbol; retrying cannot succeed
+                logger.error(f"Failed to fetch data from {endpoint}: {str(e)}")
+                raise
             if attempt < retries - 1:
-                sleep(delay)
+                sleep(_retry_delay(attempt, delay, e))
             else:
                 logger.error(
                     f"Failed to fetch data from {endpoint} after {retries} attempts: {str(e)}"
@@ -136,6 +713,81 @@ def fetch_data_from_nse(endpoint, params=None, retries=3, delay=2, timeout=10):
                 raise
 
 
+# (ETag, Last-Modified, raw body) of the last response per cache key, used to
+# revalidate slow-changing endpoints with a conditional GET
+_validators: Dict[str, Tuple[Optional[str], Optional[str], bytes]] = {}
+_validators_lock = threading.Lock()
+
+
+def _fetch_conditional(endpoint, params=None, retries=3, delay=2, timeout=10):
+    """Fetch data from an NSE endpoint, revalidating the previous response.
+
+    When an earlier response carried an ETag or Last-Modified header, the
+    request is sent with If-None-Match / If-Modified-Since and a 304 reply
+    decodes the stored body instead of downloading it again. Retries follow
+    `_fetch_uncached`.
+    """
+    key = _cache_key(endpoint, params)
+    with _validators_lock:
+        previous = _validators.get(key)
+
+    headers = {}
+    if previous:
+        etag, last_modified, _ = previous
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+    def parse(response):
+        if previous and response.status_code == 304:
+            logger.info(f"{endpoint} not modified, reusing previous response")
+            # Decode per call so callers never share (and mutate) one object
+            return _json_loads(previous[2])
+        data = _decode_json(response)
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            with _validators_lock:
+                _validators[key] = (etag, last_modified, response.content)
+        return data
+
+    return _fetch_uncached(
+        endpoint, params, retries, delay, timeout, headers=headers, parse=parse
+    )
+
+
+# NSE trading symbols: upper-case letters, digits, "&" and "-" (e.g. M&M, BAJAJ-AUTO)
+_SYMBOL_RE = re.compile(r"[A-Z0-9&\-]{1,20}")
+
+
+def _normalize_symbol(symbol: str) -> str:
+    """Upper-case and validate a trading symbol before it is sent to NSE.
+
+    Raises:
+        ValueError: If the symbol cannot be a valid NSE symbol.
+    """
+    normalized = symbol.strip().upper() if isinstance(symbol, str) else ""
+    if not _SYMBOL_RE.fullmatch(normalized):
+        raise ValueError(f"Invalid symbol: {symbol}")
+    return normalized
+
+
+# Allowed values for Literal-typed parameters that are checked at runtime
+_HOLIDAY_TYPES = frozenset({"trading", "clearing"})
+_MOST_ACTIVE_INDICES = frozenset({"volume", "value"})
+_PRICE_BAND_TYPES = frozenset({"upper", "lower", "both"})
+_PRICE_BAND_CATEGORIES = frozenset({"AllSec", "SecGtr20", "SecLwr20"})
+
+
+def _validate_choice(value: Any, allowed: frozenset, name: str) -> None:
+    """Raise ValueError unless `value` is one of `allowed`."""
+    if value not in allowed:
+        choices = ", ".join(repr(choice) for choice in sorted(allowed))
+        raise ValueError(f"{name} must be one of {choices}")
+
+
+@_memoize(ttl=60.0)
 def get_market_status() -> Dict:
     """Fetch the current market status.
 
@@ -145,9 +797,98 @@ def get_market_status() -> Dict:
     """
     endpoint = "marketStatus"
     try:
-        return fetch_data_from_nse(endpoint)
+        return fetch_data_from_nse(endpoint, ttl=0)
     except requests.exceptions.RequestException as e:
-        raise Exception(f"Failed to fetch market status: {e}")
+        raise NSEAPIError(f"Failed to fetch market status: {e}") from e
+
+
+# Maximum simultaneous bhavcopy downloads from nsearchives.nseindia.com
+_MAX_ARCHIVE_DOWNLOADS = 8
+_archive_semaphore = threading.Semaphore(_MAX_ARCHIVE_DOWNLOADS)
+
+# Chunk size for copying decompressed gzip data; larger than the 16 KiB default
+_GZIP_READ_BUFFER = 128 * 1024
+
+# (connect, read) timeout for archive downloads; the read timeout bounds
+# each wait for data, not the whole transfer, so large files still finish
+_DOWNLOAD_TIMEOUT = (3.05, 60)
+
+_MONTHS = tuple("JAN FEB MAR APR MAY JUN JUL AUG SEP OCT NOV DEC".split())
+
+
+# bhavcopy type -> (URL template, how the download is stored)
+_BHAV_URLS = {
+    "equity": (
+        "https://nsearchives.nseindia.com/content/cm/"
+        "BhavCopy_NSE_CM_0_0_0_{ymd}_F_0000.csv.zip",
+        "zip",
+    ),
+    "delivery": (
+        "https://nsearchives.nseindia.com/products/content/sec_bhavdata_full_{dmy}.csv",
+        "csv",
+    ),
+    "indices": (
+        "https://www1.nseindia.com/content/indices/ind_close_all_{dmy}.csv",
+        "csv",
+    ),
+    "fno": (
+        "https://nsearchives.nseindia.com/content/fo/"
+        "BhavCopy_NSE_FO_0_0_0_{ymd}_F_0000.csv.zip",
+        "zip",
+    ),
+    "priceband": (
+        "https://nsearchives.nseindia.com/content/equities/sec_list_{dmy}.csv",
+        "csv",
+    ),
+    "pr": (
+        "https://nsearchives.nseindia.com/archives/equities/bhavcopy/pr/PR{dd}{mm}{yy}.zip",
+        "zip",
+    ),
+    "cm_mii": (
+        "https://nsearchives.nseindia.com/content/cm/NSE_CM_security_{dmy}.csv.gz",
+        "gz",
+    ),
+}
+
+# Equity bhavcopies before 2024 use the legacy archive layout
+_LEGACY_EQUITY_URL = (
+    "https://nsearchives.nseindia.com/content/historical/"
+    "EQUITIES/{yyyy}/{mon}/cm{dd}{mon}{yyyy}bhav.csv.zip"
+)
+
+
+@lru_cache(maxsize=256)
+def _bhavcopy_url(bhavcopy_type: str, ordinal: int) -> Tuple[str, str]:
+    """Build the download URL for a bhavcopy type on the day with the given ordinal.
+
+    Date fragments are formatted once with f-strings instead of repeated
+    strftime calls, and the result is cached per (type, day).
+
+    Returns:
+        Tuple[str, str]: The URL and the download kind ("zip", "gz" or "csv").
+    """
+    try:
+        template, kind = _BHAV_URLS[bhavcopy_type]
+    except KeyError:
+        raise ValueError(f"Invalid bhavcopy_type: {bhavcopy_type}")
+
+    day = date.fromordinal(ordinal)
+    if bhavcopy_type == "equity" and day.year < 2024:
+        template = _LEGACY_EQUITY_URL
+
+    yyyy = f"{day.year:04d}"
+    mm = f"{day.month:02d}"
+    dd = f"{day.day:02d}"
+    fragments = {
+        "yyyy": yyyy,
+        "yy": yyyy[2:],
+        "mm": mm,
+        "dd": dd,
+        "mon": _MONTHS[day.month - 1],
+        "ymd": f"{yyyy}{mm}{dd}",
+        "dmy": f"{dd}{mm}{yyyy}",
+    }
+    return template.format_map(fragments), kind
 
 
 def get_bhavcopy(
@@ -156,6 +897,7 @@ def get_bhavcopy(
     ],
     date: datetime,
     download_dir: str = None,
+    overwrite: bool = False,
 ) -> Path:
     """Download the specified type of bhavcopy report for the given date.
 
@@ -166,6 +908,7 @@ def get_bhavcopy(
         date: The date for which to download the bhavcopy.
 
         download_dir: Directory to save the file. Defaults to the current directory.
+        overwrite: Download again even if the file already exists. Defaults to False.
 
     Returns:
         Path: Path to the downloaded file.
@@ -175,102 +918,218 @@ def get_bhavcopy(
         FileNotFoundError: If the download fails or the file is corrupted.
         RuntimeError: If the report is unavailable or not yet updated.
     """
+    # Only needed for downloads, so kept out of `import nseapi`
+    import tempfile
+    import zipfile
+
     target_directory = Path(download_dir) if download_dir else Path.cwd()
-    target_directory.mkdir(parents=True, exist_ok=True)
 
-    # Define URLs for each bhavcopy type
-    if bhavcopy_type == "equity":
-        if date.year >= 2024:
-            url = (f"https://nsearchives.nseindia.com/content/cm/"
-                   f"BhavCopy_NSE_CM_0_0_0_{date.strftime('%Y%m%d')}_F_0000.csv.zip")
-        else:
-            url = (f"https://nsearchives.nseindia.com/content/historical/"
-                   f"EQUITIES/{date.strftime('%Y')}/{date.strftime('%b').upper()}/"
-                   f"cm{date.strftime('%d%b%Y').upper()}bhav.csv.zip")
-    elif bhavcopy_type == "delivery":
-        url = f"https://nsearchives.nseindia.com/products/content/sec_bhavdata_full_{date.strftime('%d%m%Y')}.csv"
-    elif bhavcopy_type == "indices":
-
-        url = f"https://www1.nseindia.com/content/indices/ind_close_all_{date.strftime('%d%m%Y')}.csv"
-    elif bhavcopy_type == "fno":
-        url = (f"https://nsearchives.nseindia.com/content/fo/"
-               f"BhavCopy_NSE_FO_0_0_0_{date.strftime('%Y%m%d')}_F_0000.csv.zip")
-    elif bhavcopy_type == "priceband":
-        url = f"https://nsearchives.nseindia.com/content/equities/sec_list_{date.strftime('%d%m%Y')}.csv"
-    elif bhavcopy_type == "pr":
-        url = f"https://nsearchives.nseindia.com/archives/equities/bhavcopy/pr/PR{date.strftime('%d%m%y')}.zip"
-    elif bhavcopy_type == "cm_mii":
-        url = f"https://nsearchives.nseindia.com/content/cm/NSE_CM_security_{date.strftime('%d%m%Y')}.csv.gz"
-    else:
-        raise ValueError(f"Invalid bhavcopy_type: {bhavcopy_type}")
+    url, kind = _bhavcopy_url(bhavcopy_type, date.toordinal())
 
-    try:
-        response = session.get(url, cookies=_fetch_cookies())
-        response.raise_for_status()
+    ymd = f"{date.year:04d}{date.month:02d}{date.day:02d}"
+    csv_path = target_directory / f"{bhavcopy_type}_bhavcopy_{ymd}.csv"
 
-        file_name = f"{bhavcopy_type}_bhavcopy_{date.strftime('%Y%m%d')}"
-        file_path = target_directory / file_name
+    # Published bhavcopies never change, so an existing non-empty file is
+    # reused; a single stat() covers both the existence and size checks
+    if not overwrite:
+        try:
+            if csv_path.stat().st_size > 0:
+                logger.info(f"Using cached {bhavcopy_type} bhavcopy at {csv_path}")
+                return csv_path
+        except FileNotFoundError:
+            pass
 
-        # Save the file
-        if bhavcopy_type in ["equity", "fno", "pr"]:
+    # Only needed when something will actually be written
+    target_directory.mkdir(parents=True, exist_ok=True)
 
-            file_path = file_path.with_suffix(".zip")
-            with open(file_path, "wb") as file:
-                file.write(response.content)
+    # Bound concurrent downloads from the archive host
+    with _archive_semaphore:
+        part_path = None
+        try:
+            # Write to a uniquely named .part file and swap it in, so an
+            # interrupted download is never reused and concurrent calls for the
+            # same report don't write into the same file
+            fd, part_name = tempfile.mkstemp(
+                dir=target_directory, prefix=f"{csv_path.stem}.", suffix=".part"
+            )
+            part_path = Path(part_name)
+
+            _fetch_cookies()
+            # Closing the streamed response hands its connection back to the
+            # pool even when decompression or the disk write fails
+            with os.fdopen(fd, "wb") as dst, session.get(
+                url, stream=True, timeout=_DOWNLOAD_TIMEOUT
+            ) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+
+                if kind == "zip":
+                    # Buffer the zip in memory (spilling to a temp file if large)
+                    # and copy its CSV member straight to the final file name
+                    with tempfile.SpooledTemporaryFile(max_size=16 << 20) as buffer:
+                        shutil.copyfileobj(response.raw, buffer, 1 << 20)
+                        buffer.seek(0)
+
+                        with zipfile.ZipFile(buffer, "r") as zip_ref:
+                            member = zip_ref.infolist()[0]
+                            with zip_ref.open(member) as src:
+                                shutil.copyfileobj(src, dst, _GZIP_READ_BUFFER)
+
+                elif kind == "gz":
+                    # Decompress straight from the response stream
+                    with _gzip.GzipFile(fileobj=response.raw) as gz_file:
+                        shutil.copyfileobj(gz_file, dst, _GZIP_READ_BUFFER)
+
+                else:
+                    shutil.copyfileobj(response.raw, dst, 1 << 20)
+
+            os.replace(part_path, csv_path)
+            return csv_path
 
-            # Extract the zip file
-            with zipfile.ZipFile(file_path, "r") as zip_ref:
-                zip_ref.extractall(target_directory)
-                extracted_file_name = zip_ref.namelist()[0]
+        # Reading response.raw directly surfaces urllib3's own errors (a body
+        # cut short, a read timeout) rather than requests exceptions
+        except (requests.exceptions.RequestException, _Urllib3Error) as e:
+            raise FileNotFoundError(
+                f"Failed to download {bhavcopy_type} bhavcopy: {e}"
+            ) from e
+        except (zipfile.BadZipFile, gzip.BadGzipFile, EOFError) as e:
+            raise RuntimeError(f"Invalid file received: {e}") from e
+        except OSError as e:
+            raise RuntimeError(f"File operation failed: {e}") from e
+        finally:
+            # Only left behind when the download failed
+            if part_path is not None:
+                part_path.unlink(missing_ok=True)
+
+
+def get_bhavcopies(
+    bhavcopy_type: Literal[
+        "equity", "delivery", "indices", "fno", "priceband", "pr", "cm_mii"
+    ],
+    dates: List[datetime],
+    download_dir: str = None,
+    concurrency: int = _MAX_ARCHIVE_DOWNLOADS,
+    overwrite: bool = False,
+) -> List[Path]:
+    """Download the specified type of bhavcopy for several dates in parallel.
 
-                extracted_file_path = target_directory / extracted_file_name
+    Args:
+        bhavcopy_type: Type of bhavcopy to download (see `get_bhavcopy`).
+        dates: The dates for which to download the bhavcopy.
+        download_dir: Directory to save the files. Defaults to the current directory.
+        concurrency: Maximum number of simultaneous downloads. Defaults to 8.
+        overwrite: Download again even if a file already exists. Defaults to False.
 
-            # Rename the extracted file
-            new_file_name = f"{bhavcopy_type}_bhavcopy_{date.strftime('%Y%m%d')}.csv"
-            new_file_path = target_directory / new_file_name
+    Returns:
+        List[Path]: Paths to the downloaded files, in the same order as `dates`.
 
-            if extracted_file_path != new_file_path:
+    Raises:
+        The first exception raised by `get_bhavcopy` for any of the dates.
+    """
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        return list(
+            executor.map(
+                lambda day: get_bhavcopy(bhavcopy_type, day, download_dir, overwrite),
+                dates,
+            )
+        )
 
-                os.rename(extracted_file_path, new_file_path)
 
-            # Clean up the zip file
-            os.remove(file_path)
-            return new_file_path
+def get_bhavcopy_range(
+    bhavcopy_type: Literal[
+        "equity", "delivery", "indices", "fno", "priceband", "pr", "cm_mii"
+    ],
+    from_date: datetime,
+    to_date: datetime,
+    download_dir: str = None,
+    concurrency: int = _MAX_ARCHIVE_DOWNLOADS,
+    overwrite: bool = False,
+) -> List[Path]:
+    """Download the specified type of bhavcopy for every weekday in a date range.
 
-        elif bhavcopy_type == "cm_mii":
-            file_path = file_path.with_suffix(".gz")
-            with open(file_path, "wb") as file:
-                file.write(response.content)
+    Weekends are skipped. Days on which NSE published no report (exchange
+    holidays) are logged and left out of the result.
 
-            # Extract the gz file
-            csv_path = (
-                target_directory
-                / f"{bhavcopy_type}_bhavcopy_{date.strftime('%Y%m%d')}.csv"
-            )
-            with gzip.open(file_path, "rb") as gz_file:
-                with open(csv_path, "wb") as csv_file:
-                    shutil.copyfileobj(gz_file, csv_file)
+    Args:
+        bhavcopy_type: Type of bhavcopy to download (see `get_bhavcopy`).
+        from_date: First date of the range (inclusive).
+        to_date: Last date of the range (inclusive).
+        download_dir: Directory to save the files. Defaults to the current directory.
+        concurrency: Maximum number of simultaneous downloads. Defaults to 8.
+        overwrite: Download again even if a file already exists. Defaults to False.
 
-            # Clean up the gz file
+    Returns:
+        List[Path]: Paths to the downloaded files in date order.
 
-            os.remove(file_path)
-            return csv_path
+    Raises:
+        ValueError: If `from_date` is greater than `to_date`.
+        FileNotFoundError: If a download fails for a reason other than a missing report.
+    """
+    if from_date > to_date:
+        raise ValueError("'from_date' cannot be greater than 'to_date'")
 
-        else:
-            file_path = file_path.with_suffix(".csv")
+    dates = [
+        from_date + timedelta(days=offset)
+        for offset in range((to_date - from_date).days + 1)
+        if (from_date + timedelta(days=offset)).weekday() < 5
+    ]
 
-            with open(file_path, "wb") as file:
+    def download(day):
+        try:
+            return get_bhavcopy(bhavcopy_type, day, download_dir, overwrite)
+        except FileNotFoundError as e:
+            cause = e.__cause__
+            response = getattr(cause, "response", None)
+            if response is not None and response.status_code == 404:
+                logger.info(f"No {bhavcopy_type} bhavcopy published for {day:%d-%m-%Y}")
+                return None
+            raise
 
-                file.write(response.content)
-            return file_path
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        return [path for path in executor.map(download, dates) if path is not None]
 
-    except requests.exceptions.RequestException as e:
-        raise FileNotFoundError(f"Failed to download {bhavcopy_type} bhavcopy: {e}")
-    except (zipfile.BadZipFile, gzip.BadGzipFile) as e:
 
-        raise RuntimeError(f"Invalid file received: {e}")
-    except OSError as e:
-        raise RuntimeError(f"File operation failed: {e}")
+async def aget_bhavcopy(
+    bhavcopy_type: Literal[
+        "equity", "delivery", "indices", "fno", "priceband", "pr", "cm_mii"
+    ],
+    date: datetime,
+    download_dir: str = None,
+    overwrite: bool = False,
+) -> Path:
+    """Async variant of `get_bhavcopy` for use with asyncio.gather.
+
+    The download runs in a worker thread over the shared session, and
+    concurrent downloads are capped the same way as in `get_bhavcopies`.
+    """
+    return await _run_in_thread(
+        get_bhavcopy, bhavcopy_type, date, download_dir, overwrite
+    )
+
+
+# (output field, path into NSE's quote-equity response, default) for get_stock_quote
+_QUOTE_FIELDS = (
+    ("symbol", ("info", "symbol"), None),
+    ("company_name", ("info", "companyName"), "N/A"),
+    ("current_price", ("priceInfo", "lastPrice"), None),
+    ("open", ("priceInfo", "open"), 0),
+    ("high", ("priceInfo", "intraDayHighLow", "max"), 0),
+    ("low", ("priceInfo", "intraDayHighLow", "min"), 0),
+    ("close", ("priceInfo", "close"), 0),
+    ("volume", ("preOpenMarket", "totalTradedVolume"), 0),
+    ("52_week_high", ("priceInfo", "weekHighLow", "max"), 0),
+    ("52_week_low", ("priceInfo", "weekHighLow", "min"), 0),
+    ("market_cap", ("securityInfo", "issuedSize"), "N/A"),
+)
+
+
+def _dig(data: Dict, path: Tuple[str, ...], default: Any = None) -> Any:
+    """Return the value at `path` in nested dicts, or `default` if any key is missing."""
+    for key in path:
+        if not isinstance(data, dict) or key not in data:
+            return default
+        data = data[key]
+    return data
 
 
 def get_stock_quote(symbol: str) -> Dict:
@@ -289,10 +1148,17 @@ def get_stock_quote(symbol: str) -> Dict:
         ValueError: If the symbol is invalid or not found.
         requests.exceptions.RequestException: If the API request fails.
     """
+    # Memoize on the normalized symbol so "infy" and "INFY" share an entry
+    return _stock_quote(_normalize_symbol(symbol))
+
+
+@_memoize(ttl=5.0)
+def _stock_quote(symbol: str) -> Dict:
+    """Fetch the stock quote for an already normalized symbol."""
     endpoint = "quote-equity"
     params = {"symbol": symbol}
     try:
-        data = fetch_data_from_nse(endpoint, params=params)
+        data = fetch_data_from_nse(endpoint, params=params, ttl=0)
 
         # Handle None response (invalid symbol case)
         if data is None:
@@ -302,24 +1168,14 @@ def get_stock_quote(symbol: str) -> Dict:
             raise ValueError(f"Invalid symbol: {symbol}")
 
         return {
-            "symbol": data["info"]["symbol"],
-            "company_name": data["info"].get("companyName", "N/A"),
-            "current_price": data["priceInfo"]["lastPrice"],
-            "open": data["priceInfo"].get("open", 0),
-            "high": data["priceInfo"].get("intraDayHighLow", {}).get("max", 0),
-            "low": data["priceInfo"].get("intraDayHighLow", {}).get("min", 0),
-            "close": data["priceInfo"].get("close", 0),
-            "volume": data.get("preOpenMarket", {}).get("totalTradedVolume", 0),
-            "52_week_high": data["priceInfo"].get("weekHighLow", {}).get("max", 0),
-            "52_week_low": data["priceInfo"].get("weekHighLow", {}).get("min", 0),
-            "market_cap": data.get("securityInfo", {}).get("issuedSize", "N/A"),
+            name: _dig(data, path, default) for name, path, default in _QUOTE_FIELDS
         }
     except requests.exceptions.HTTPError as e:
-        if e.response and e.response.status_code == 404:
+        if e.response is not None and e.response.status_code == 404:
             raise ValueError(f"Invalid symbol: {symbol}")
-        raise Exception(f"Failed to fetch stock quote: {e}")
+        raise NSEAPIError(f"Failed to fetch stock quote: {e}") from e
     except requests.exceptions.RequestException as e:
-        raise Exception(f"API request failed: {e}")
+        raise NSEAPIError(f"API request failed: {e}") from e
 
 
 def get_option_chain(symbol: str, is_index: bool = False) -> Dict:
@@ -337,11 +1193,17 @@ def get_option_chain(symbol: str, is_index: bool = False) -> Dict:
         ValueError: If the symbol is invalid or not found.
         requests.exceptions.RequestException: If the API request fails.
     """
+    return _option_chain(_normalize_symbol(symbol), bool(is_index))
+
+
+@_memoize(ttl=5.0)
+def _option_chain(symbol: str, is_index: bool) -> Dict:
+    """Fetch the option chain for an already normalized symbol."""
     endpoint = "option-chain-indices" if is_index else "option-chain-equities"
     params = {"symbol": symbol}
 
     try:
-        data = fetch_data_from_nse(endpoint, params=params)
+        data = fetch_data_from_nse(endpoint, params=params, ttl=0)
 
         # Handle None response (invalid symbol case)
         if data is None:
@@ -352,45 +1214,164 @@ def get_option_chain(symbol: str, is_index: bool = False) -> Dict:
 
         return data
     except requests.exceptions.HTTPError as e:
-        if e.response and e.response.status_code == 404:
+        if e.response is not None and e.response.status_code == 404:
             raise ValueError(f"Invalid symbol: {symbol}")
-        raise Exception(f"Failed to fetch option chain: {e}")
+        raise NSEAPIError(f"Failed to fetch option chain: {e}") from e
     except requests.exceptions.RequestException as e:
-        raise Exception(f"API request failed: {e}")
+        raise NSEAPIError(f"API request failed: {e}") from e
+
+
+async def aget_stock_quote(symbol: str) -> Dict:
+    """Async variant of `get_stock_quote` for use with asyncio.gather."""
+    return await _run_in_thread(get_stock_quote, symbol)
+
+
+async def aget_stock_quotes(symbols: List[str]) -> List[Dict]:
+    """Fetch quotes for several symbols concurrently.
+
+    Args:
+        symbols (List[str]): The stock symbols (e.g., ["INFY", "TCS"]).
+
+    Returns:
+        List[Dict]: Quotes in the same order as `symbols`.
+
+    Raises:
+        The first exception raised by `get_stock_quote` for any of the symbols.
+    """
+    import asyncio
+
+    return list(await asyncio.gather(*(aget_stock_quote(s) for s in symbols)))
+
+
+async def aget_option_chain(symbol: str, is_index: bool = False) -> Dict:
+    """Async variant of `get_option_chain` for use with asyncio.gather."""
+    return await _run_in_thread(get_option_chain, symbol, is_index)
+
+
+async def aget_option_chains(symbols: List[str], is_index: bool = False) -> List[Dict]:
+    """Fetch option chains for several symbols concurrently.
+
+    Args:
+        symbols (List[str]): The stock or index symbols (e.g., ["NIFTY", "BANKNIFTY"]).
+        is_index (bool): Whether the symbols are indices. Defaults to False.
+
+    Returns:
+        List[Dict]: Option chains in the same order as `symbols`.
+
+    Raises:
+        The first exception raised by `get_option_chain` for any of the symbols.
+    """
+    import asyncio
+
+    return list(
+        await asyncio.gather(*(aget_option_chain(s, is_index) for s in symbols))
+    )
+
+
+def get_stock_quotes(
+    symbols: List[str], concurrency: int = _MAX_FANOUT_WORKERS
+) -> List[Dict]:
+    """Fetch quotes for several symbols in parallel from synchronous code.
+
+    Args:
+        symbols (List[str]): The stock symbols (e.g., ["INFY", "TCS"]).
+        concurrency (int): Maximum number of simultaneous requests. Defaults to 8.
+
+    Returns:
+        List[Dict]: Quotes in the same order as `symbols`.
+
+    Raises:
+        The first exception raised by `get_stock_quote` for any of the symbols.
+    """
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        return list(executor.map(get_stock_quote, symbols))
+
+
+# (output field, NSE field) pairs for get_all_indices
+_INDEX_FIELDS = (
+    ("name", "index"),
+    ("last_price", "last"),
+    ("change", "variation"),
+    ("percent_change", "percentChange"),
+    ("high", "high"),
+    ("low", "low"),
+    ("open", "open"),
+    ("previous_close", "previousClose"),
+)
+
+
+_INDEX_FIELD_MAP = dict(_INDEX_FIELDS)
 
 
-def get_all_indices() -> List[Dict]:
+@_memoize(ttl=5.0)
+def _all_indices_data() -> List[Dict]:
+    """Fetch NSE's rows for all indices, as-is."""
+    return fetch_data_from_nse("allIndices", ttl=0).get("data", [])
+
+
+def get_all_indices(
+    raw: bool = False, fields: Optional[Sequence[str]] = None
+) -> List[Dict]:
     """Fetch data for all NSE indices.
 
+    Args:
+        raw (bool): Return NSE's rows as-is, with NSE's own field names, instead
+            of building renamed copies. Defaults to False.
+        fields (Sequence[str], optional): Only include these output fields
+            (e.g. ["name", "last_price"]). Defaults to all fields. Ignored when
+            raw is True.
+
     Returns:
 
         List[Dict]: A list of dictionaries containing index data.
 
     Raises:
+        ValueError: If fields contains an unknown field name.
         requests.exceptions.RequestException: If the API request fails.
     """
-    endpoint = "allIndices"
-    try:
-        data = fetch_data_from_nse(endpoint)
+    if fields is None:
+        pairs = _INDEX_FIELDS
+    else:
+        unknown = [name for name in fields if name not in _INDEX_FIELD_MAP]
+        if unknown:
+            raise ValueError(f"Invalid fields: {', '.join(unknown)}")
+        pairs = tuple((name, _INDEX_FIELD_MAP[name]) for name in fields)
 
-        indices = []
-        for index in data.get("data", []):
-            indices.append(
-                {
-                    "name": index.get("index"),
-                    "last_price": index.get("last"),
-                    "change": index.get("variation"),
-                    "percent_change": index.get("percentChange"),
-                    "high": index.get("high"),
-                    "low": index.get("low"),
-                    "open": index.get("open"),
-                    "previous_close": index.get("previousClose"),
-                }
-            )
-        return indices
+    # Only the upstream rows are memoized; the projection is cheap and
+    # rebuilding it per call keeps one cache entry for every raw/fields combo
+    try:
+        rows = _all_indices_data()
+        if raw:
+            return rows
+        return [{name: index.get(key) for name, key in pairs} for index in rows]
 
     except requests.exceptions.RequestException as e:
-        raise Exception(f"Failed to fetch all indices: {e}")
+        raise NSEAPIError(f"Failed to fetch all indices: {e}") from e
+
+
+def _build_params(**kwargs) -> Dict:
+    """Build query params, dropping any that are None or False."""
+    return {k: v for k, v in kwargs.items() if v is not None and v is not False}
+
+
+def _date_range_params(
+    from_date: Optional[datetime], to_date: Optional[datetime]
+) -> Dict[str, str]:
+    """Build the from_date/to_date query params shared by the corporate endpoints.
+
+    Returns an empty dict unless both dates are given.
+
+    Raises:
+        ValueError: If `from_date` is greater than `to_date`.
+    """
+    if not (from_date and to_date):
+        return {}
+    if from_date > to_date:
+        raise ValueError("'from_date' cannot be greater than 'to_date'")
+    return {
+        "from_date": from_date.strftime("%d-%m-%Y"),
+        "to_date": to_date.strftime("%d-%m-%Y"),
+    }
 
 
 def get_corporate_actions(
@@ -416,23 +1397,14 @@ def get_corporate_actions(
         ValueError: If `from_date` is greater than `to_date`.
     """
     endpoint = "corporates-corporateActions"
-    params = {"index": segment}
-    if symbol:
-        params["symbol"] = symbol
-    if from_date and to_date:
-        if from_date > to_date:
-            raise ValueError("'from_date' cannot be greater than 'to_date'")
-        params.update(
-            {
-                "from_date": from_date.strftime("%d-%m-%Y"),
-                "to_date": to_date.strftime("%d-%m-%Y"),
-            }
-        )
+    params = _build_params(
+        index=segment, symbol=symbol or None, **_date_range_params(from_date, to_date)
+    )
 
     try:
         return fetch_data_from_nse(endpoint, params=params)
     except requests.exceptions.RequestException as e:
-        raise Exception(f"Failed to fetch corporate actions: {e}")
+        raise NSEAPIError(f"Failed to fetch corporate actions: {e}") from e
 
 
 def get_announcements(
@@ -461,29 +1433,21 @@ def get_announcements(
         ValueError: If `from_date` is greater than `to_date`.
     """
     endpoint = "corporate-announcements"
-    params = {"index": index}
-
-    if symbol:
-        params["symbol"] = symbol
-
-    if fno:
-        params["fo_sec"] = True
-    if from_date and to_date:
-        if from_date > to_date:
-            raise ValueError("'from_date' cannot be greater than 'to_date'")
-        params.update(
-            {
-                "from_date": from_date.strftime("%d-%m-%Y"),
-                "to_date": to_date.strftime("%d-%m-%Y"),
-            }
-        )
+    # NSE expects a lowercase "true"; requests would send a bool as "True"
+    params = _build_params(
+        index=index,
+        symbol=symbol or None,
+        fo_sec="true" if fno else None,
+        **_date_range_params(from_date, to_date),
+    )
 
     try:
         return fetch_data_from_nse(endpoint, params=params)
     except requests.exceptions.RequestException as e:
-        raise Exception(f"Failed to fetch corporate announcements: {e}")
+        raise NSEAPIError(f"Failed to fetch corporate announcements: {e}") from e
 
 
+@_memoize(ttl=3600.0)
 def get_holidays(
     holiday_type: Literal["trading", "clearing"] = "trading"
 ) -> Dict[str, List[Dict]]:
@@ -499,17 +1463,17 @@ def get_holidays(
         ValueError: If `holiday_type` is not "trading" or "clearing".
         Exception: If the API request fails.
     """
-    if holiday_type not in ["trading", "clearing"]:
-        raise ValueError("holiday_type must be 'trading' or 'clearing'")
+    _validate_choice(holiday_type, _HOLIDAY_TYPES, "holiday_type")
 
     endpoint = "holiday-master"
     params = {"type": holiday_type}
 
     try:
-        data = fetch_data_from_nse(endpoint, params=params)
+        # The holiday list rarely changes, so revalidate instead of refetching
+        data = _fetch_conditional(endpoint, params=params)
         return data
     except Exception as e:
-        raise Exception(f"Failed to fetch holiday information: {e}")
+        raise NSEAPIError(f"Failed to fetch holiday information: {e}") from e
 
 
 def bulk_deals(from_date: datetime, to_date: datetime) -> List[Dict]:
@@ -543,9 +1507,15 @@ def bulk_deals(from_date: datetime, to_date: datetime) -> List[Dict]:
 
         return data["data"]
     except requests.exceptions.RequestException as e:
-        raise Exception(f"Failed to download bulk deals: {e}")
+        raise NSEAPIError(f"Failed to download bulk deals: {e}") from e
+
+
+async def abulk_deals(from_date: datetime, to_date: datetime) -> List[Dict]:
+    """Async variant of `bulk_deals` for use with asyncio.gather."""
+    return await _run_in_thread(bulk_deals, from_date, to_date)
 
 
+@_memoize(ttl=60.0)
 def get_fii_dii_data() -> List[Dict]:
     """Fetch FII (Foreign Institutional Investors) and DII (Domestic Institutional Investors) trading activity data.
 
@@ -558,12 +1528,13 @@ def get_fii_dii_data() -> List[Dict]:
     """
     endpoint = "fiidiiTradeReact"
     try:
-        data = fetch_data_from_nse(endpoint)
+        data = fetch_data_from_nse(endpoint, ttl=0)
         return data
     except requests.exceptions.RequestException as e:
-        raise Exception(f"Failed to fetch FII/DII data: {e}")
+        raise NSEAPIError(f"Failed to fetch FII/DII data: {e}") from e
 
 
+@_memoize(ttl=5.0)
 def get_top_gainers() -> Dict:
     """Fetch the top gainers data from NSE.
 
@@ -574,13 +1545,14 @@ def get_top_gainers() -> Dict:
     endpoint = "live-analysis-variations"
     params = {"index": "gainers"}
     try:
-        data = fetch_data_from_nse(endpoint, params=params)
+        data = fetch_data_from_nse(endpoint, params=params, ttl=0)
 
         return data
     except Exception as e:
-        raise Exception(f"Failed to fetch top gainers: {e}")
+        raise NSEAPIError(f"Failed to fetch top gainers: {e}") from e
 
 
+@_memoize(ttl=5.0)
 def get_top_losers() -> Dict:
     """Fetch the top losers data from NSE.
 
@@ -590,10 +1562,10 @@ def get_top_losers() -> Dict:
     endpoint = "live-analysis-variations"
     params = {"index": "loosers"}
     try:
-        data = fetch_data_from_nse(endpoint, params=params)
+        data = fetch_data_from_nse(endpoint, params=params, ttl=0)
         return data
     except Exception as e:
-        raise Exception(f"Failed to fetch top losers: {e}")
+        raise NSEAPIError(f"Failed to fetch top losers: {e}") from e
 
 
 def get_regulatory_status() -> Dict:
@@ -609,7 +1581,7 @@ def get_regulatory_status() -> Dict:
         data = fetch_data_from_nse(endpoint)
         return data
     except Exception as e:
-        raise Exception(f"Failed to fetch regulatory status: {e}")
+        raise NSEAPIError(f"Failed to fetch regulatory status: {e}") from e
 
 
 def get_most_active_equities(index: Literal["volume", "value"]) -> List[Dict]:
@@ -626,8 +1598,7 @@ def get_most_active_equities(index: Literal["volume", "value"]) -> List[Dict]:
         ValueError: If the index is not "volume" or "value".
         requests.exceptions.RequestException: If the API request fails.
     """
-    if index not in ["volume", "value"]:
-        raise ValueError("index must be 'volume' or 'value'")
+    _validate_choice(index, _MOST_ACTIVE_INDICES, "index")
 
     endpoint = "live-analysis-most-active-securities"
     params = {"index": index}
@@ -650,8 +1621,7 @@ def get_most_active_sme(index: Literal["volume", "value"]) -> List[Dict]:
         ValueError: If the index is not "volume" or "value".
         requests.exceptions.RequestException: If the API request fails.
     """
-    if index not in ["volume", "value"]:
-        raise ValueError("index must be 'volume' or 'value'")
+    _validate_choice(index, _MOST_ACTIVE_INDICES, "index")
 
     endpoint = "live-analysis-most-active-sme"
     params = {"index": index}
@@ -677,8 +1647,7 @@ def get_most_active_etf(index: Literal["volume", "value"]) -> List[Dict]:
         requests.exceptions.RequestException: If the API request fails.
 
     """
-    if index not in ["volume", "value"]:
-        raise ValueError("index must be 'volume' or 'value'")
+    _validate_choice(index, _MOST_ACTIVE_INDICES, "index")
 
     endpoint = "live-analysis-most-active-etf"
     params = {"index": index}
@@ -747,11 +1716,8 @@ def get_price_band_hitters(
         requests.exceptions.RequestException: If the API request fails.
 
     """
-    if band_type not in ["upper", "lower", "both"]:
-        raise ValueError("band_type must be 'upper', 'lower', or 'both'")
-    if category not in ["AllSec", "SecGtr20", "SecLwr20"]:
-
-        raise ValueError("category must be 'AllSec', 'SecGtr20', or 'SecLwr20'")
+    _validate_choice(band_type, _PRICE_BAND_TYPES, "band_type")
+    _validate_choice(category, _PRICE_BAND_CATEGORIES, "category")
 
     endpoint = "live-analysis-price-band-hitter"
     try:
@@ -816,6 +1782,7 @@ def get_52_week_counts() -> Dict[str, int]:
     return {"high": response.get("high", 0), "low": response.get("low", 0)}
 
 
+@_memoize(ttl=60.0)
 def get_52_week_data_by_symbol(symbol: str) -> List[Dict]:
     """
     Fetch 52-week high and low data for a specific symbol.
@@ -835,17 +1802,17 @@ def get_52_week_data_by_symbol(symbol: str) -> List[Dict]:
     params = {"sym": symbol}
 
     try:
-        response = fetch_data_from_nse(endpoint, params=params)
+        response = fetch_data_from_nse(endpoint, params=params, ttl=0)
         if not response:
             raise ValueError(f"No data found for symbol: {symbol}")
         return response
     except requests.exceptions.HTTPError as e:
-        if e.response.status_code == 404:
+        if e.response is not None and e.response.status_code == 404:
 
             raise ValueError(f"Invalid symbol: {symbol}")
-        raise Exception(f"Failed to fetch 52-week data: {e}")
+        raise NSEAPIError(f"Failed to fetch 52-week data: {e}") from e
     except requests.exceptions.RequestException as e:
-        raise Exception(f"API request failed: {e}")
+        raise NSEAPIError(f"API request failed: {e}") from e
 
 
 def get_large_deals() -> Dict:
@@ -917,7 +1884,7 @@ def get_large_deals() -> Dict:
         }
     except requests.exceptions.RequestException as e:
 
-        raise Exception(f"Failed to fetch large deals data: {e}")
+        raise NSEAPIError(f"Failed to fetch large deals data: {e}") from e
 
 
 def get_advance_data(symbol: Optional[str] = None) -> Dict:
@@ -936,7 +1903,7 @@ def get_advance_data(symbol: Optional[str] = None) -> Dict:
             - "data": List of dictionaries with detailed stock data.
     """
     endpoint = "live-analysis-advance"
-    params = {"symbol": symbol} if symbol else None
+    params = _build_params(symbol=symbol or None)
     try:
         data = fetch_data_from_nse(endpoint, params=params)
         if symbol:
@@ -946,7 +1913,7 @@ def get_advance_data(symbol: Optional[str] = None) -> Dict:
             "data": data.get("advance", {}).get("data", []),
         }
     except Exception as e:
-        raise Exception(f"Failed to fetch advance data: {e}")
+        raise NSEAPIError(f"Failed to fetch advance data: {e}") from e
 
 
 def get_decline_data(symbol: Optional[str] = None) -> Dict:
@@ -963,7 +1930,7 @@ def get_decline_data(symbol: Optional[str] = None) -> Dict:
             - "data": List of dictionaries with detailed stock data.
     """
     endpoint = "live-analysis-decline"
-    params = {"symbol": symbol} if symbol else None
+    params = _build_params(symbol=symbol or None)
     try:
         data = fetch_data_from_nse(endpoint, params=params)
 
@@ -975,7 +1942,7 @@ def get_decline_data(symbol: Optional[str] = None) -> Dict:
         }
     except Exception as e:
 
-        raise Exception(f"Failed to fetch decline data: {e}")
+        raise NSEAPIError(f"Failed to fetch decline data: {e}") from e
 
 
 def get_unchanged_data(symbol: Optional[str] = None) -> Dict:
@@ -999,7 +1966,7 @@ def get_unchanged_data(symbol: Optional[str] = None) -> Dict:
         Exception: If the API request fails.
     """
     endpoint = "live-analysis-unchanged"
-    params = {"symbol": symbol} if symbol else None
+    params = _build_params(symbol=symbol or None)
     try:
         data = fetch_data_from_nse(endpoint, params=params)
         if symbol:
@@ -1019,7 +1986,7 @@ def get_unchanged_data(symbol: Optional[str] = None) -> Dict:
             "timestamp": data.get("timestamp", "N/A"),
         }
     except Exception as e:
-        raise Exception(f"Failed to fetch unchanged data: {e}")
+        raise NSEAPIError(f"Failed to fetch unchanged data: {e}") from e
 
 
 def get_stocks_traded() -> Dict[str, Any]:
@@ -1034,7 +2001,7 @@ def get_stocks_traded() -> Dict[str, Any]:
         data = fetch_data_from_nse(endpoint)
         return data
     except requests.exceptions.RequestException as e:
-        raise Exception(f"Failed to fetch stocks traded data: {e}")
+        raise NSEAPIError(f"Failed to fetch stocks traded data: {e}") from e
 
 
 def get_stocks_traded_by_symbol(symbol: str) -> List[Dict[str, Any]]:
@@ -1063,12 +2030,12 @@ def get_stocks_traded_by_symbol(symbol: str) -> List[Dict[str, Any]]:
 
         return data
     except requests.exceptions.HTTPError as e:
-        if e.response.status_code == 404:
+        if e.response is not None and e.response.status_code == 404:
             raise ValueError(f"Invalid symbol: {symbol}")
-        raise Exception(f"Failed to fetch stocks traded data: {e}")
+        raise NSEAPIError(f"Failed to fetch stocks traded data: {e}") from e
 
     except requests.exceptions.RequestException as e:
-        raise Exception(f"API request failed: {e}")
+        raise NSEAPIError(f"API request failed: {e}") from e
 
 
 __version__ = "0.1.0"
@@ -1139,7 +2106,7 @@ def get_fno_lot_sizes() -> Dict[str, int]:
         
         content = response.content
         if not content:
-            raise Exception("No data received from F&O lot sizes endpoint")
+            raise NSEAPIError("No data received from F&O lot sizes endpoint")
         
         # Parse CSV content
         lot_sizes = {}
@@ -1169,13 +2136,13 @@ def get_fno_lot_sizes() -> Dict[str, int]:
                 continue
         
         if not lot_sizes:
-            raise Exception("No valid lot size data found")
+            raise NSEAPIError("No valid lot size data found")
             
         logger.info(f"Successfully fetched lot sizes for {len(lot_sizes)} F&O symbols")
         return lot_sizes
         
     except Exception as e:
-        raise Exception(f"Failed to fetch F&O lot sizes: {e}")
+        raise NSEAPIError(f"Failed to fetch F&O lot sizes: {e}") from e
 
 
 def get_historical_index_data(
@@ -1228,8 +2195,9 @@ def get_historical_index_data(
     date_chunks = _split_date_range(from_date, to_date, max_chunk_size=365)
     all_price_data = []
     all_turnover_data = []
-    
-    for chunk_start, chunk_end in date_chunks:
+
+    def fetch_chunk(chunk):
+        chunk_start, chunk_end = chunk
         endpoint = "historical/indicesHistory"
         params = {
             "indexType": index.upper(),
@@ -1239,24 +2207,28 @@ def get_historical_index_data(
         
         try:
             logger.debug(f"Fetching index data for {index} from {chunk_start} to {chunk_end}")
-            response = fetch_data_from_nse(endpoint, params=params)
-            
-            if response and "data" in response:
-                data = response["data"]
-                
-                # Extract price and turnover data
-                if "indexCloseOnlineRecords" in data:
-                    all_price_data.extend(data["indexCloseOnlineRecords"])
-                    
-                if "indexTurnoverRecords" in data:
-                    all_turnover_data.extend(data["indexTurnoverRecords"])
-            
+            return fetch_data_from_nse(endpoint, params=params)
         except Exception as e:
             logger.warning(f"Failed to fetch index data chunk for {index}: {e}")
-            continue
+            return None
+
+    # Chunks are independent, so fetch them concurrently and keep their order
+    with ThreadPoolExecutor(max_workers=_MAX_FANOUT_WORKERS) as executor:
+        responses = list(executor.map(fetch_chunk, date_chunks))
+
+    for response in responses:
+        if response and "data" in response:
+            data = response["data"]
+
+            # Extract price and turnover data
+            if "indexCloseOnlineRecords" in data:
+                all_price_data.extend(data["indexCloseOnlineRecords"])
+
+            if "indexTurnoverRecords" in data:
+                all_turnover_data.extend(data["indexTurnoverRecords"])
     
     if not all_price_data and not all_turnover_data:
-        raise Exception(f"No historical data found for index: {index}")
+        raise NSEAPIError(f"No historical data found for index: {index}")
         
     return {
         "price": all_price_data,
@@ -1264,6 +2236,7 @@ def get_historical_index_data(
     }
 
 
+@_memoize(ttl=3600.0)
 def get_equity_metadata(symbol: str) -> Dict:
     """
     Get detailed metadata information for an equity symbol.
@@ -1293,7 +2266,7 @@ def get_equity_metadata(symbol: str) -> Dict:
     params = {"symbol": symbol.strip().upper()}
     
     try:
-        data = fetch_data_from_nse(endpoint, params=params)
+        data = fetch_data_from_nse(endpoint, params=params, ttl=0)
         
         if not data:
             raise ValueError(f"No metadata found for symbol: {symbol}")
@@ -1307,7 +2280,7 @@ def get_equity_metadata(symbol: str) -> Dict:
     except Exception as e:
         if "404" in str(e) or "not found" in str(e).lower():
             raise ValueError(f"Symbol not found: {symbol}")
-        raise Exception(f"Failed to fetch metadata for '{symbol}': {e}")
+        raise NSEAPIError(f"Failed to fetch metadata for '{symbol}': {e}") from e
 
 
 def get_symbol_lookup(query: str) -> Dict:
@@ -1348,7 +2321,7 @@ def get_symbol_lookup(query: str) -> Dict:
         return data
         
     except Exception as e:
-        raise Exception(f"Failed to search for symbol '{query}': {e}")
+        raise NSEAPIError(f"Failed to search for symbol '{query}': {e}") from e
 
 
 def get_historical_equity_data(
@@ -1415,8 +2388,9 @@ def get_historical_equity_data(
     # For longer date ranges, split into chunks
     date_chunks = _split_date_range(from_date, to_date, max_chunk_size=100)
     all_data = []
-    
-    for chunk_start, chunk_end in date_chunks:
+
+    def fetch_chunk(chunk):
+        chunk_start, chunk_end = chunk
         endpoint = "historical/cm/equity"
         params = {
             "symbol": symbol.upper(),
@@ -1427,19 +2401,22 @@ def get_historical_equity_data(
         
         try:
             logger.debug(f"Fetching data for {symbol} from {chunk_start} to {chunk_end}")
-            response = fetch_data_from_nse(endpoint, params=params)
-            
-            if response and "data" in response:
-                # Add data in reverse order to maintain chronological order
-                chunk_data = list(reversed(response["data"]))
-                all_data.extend(chunk_data)
-            
+            return fetch_data_from_nse(endpoint, params=params)
         except Exception as e:
             logger.warning(f"Failed to fetch data chunk for {symbol}: {e}")
-            continue
+            return None
+
+    # Chunks are independent, so fetch them concurrently and keep their order
+    with ThreadPoolExecutor(max_workers=_MAX_FANOUT_WORKERS) as executor:
+        responses = list(executor.map(fetch_chunk, date_chunks))
+
+    for response in responses:
+        if response and "data" in response:
+            # Add data in reverse order to maintain chronological order
+            all_data.extend(reversed(response["data"]))
     
     if not all_data:
-        raise Exception(f"No historical data found for symbol: {symbol}")
+        raise NSEAPIError(f"No historical data found for symbol: {symbol}")
         
     return all_data
 
@@ -1447,13 +2424,22 @@ def get_historical_equity_data(
 __all__ = [
     "get_market_status",
     "get_bhavcopy",
+    "get_bhavcopies",
+    "get_bhavcopy_range",
+    "aget_bhavcopy",
     "get_stock_quote",
+    "aget_stock_quote",
+    "aget_stock_quotes",
+    "get_stock_quotes",
     "get_option_chain",
+    "aget_option_chain",
+    "aget_option_chains",
     "get_all_indices",
     "get_corporate_actions",
     "get_announcements",
     "get_holidays",
     "bulk_deals",
+    "abulk_deals",
     "get_fii_dii_data",
     "get_top_gainers",
     "get_top_losers",
@@ -1479,4 +2465,9 @@ __all__ = [
     "get_historical_equity_data",
     "get_historical_index_data",
     "get_fno_lot_sizes",
+    "afetch_data_from_nse",
+    "afetch_many",
+    "clear_cache",
+    "pop_cache_status",
+    "NSEAPIError",
 ]
@@ -0,0 +1,107 @@
+import unittest
+from unittest.mock import patch
+
+from backend.app import app
+from nseapi import clear_cache
+
+
+class TestBackend(unittest.TestCase):
+
+    def setUp(self):
+        clear_cache()
+        self.client = app.test_client()
+
+    def tearDown(self):
+        clear_cache()
+
+    # Query converters
+    def test_query_bool_false_is_converted(self):
+        chain = {"records": {"data": []}}
+        with patch("nseapi.fetch_data_from_nse", return_value=chain) as mock_fetch:
+            response = self.client.get("/option-chain/NIFTY?is_index=false")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(mock_fetch.call_args[0][0], "option-chain-equities")
+
+    def test_query_fields_are_split(self):
+        data = {"data": [{"index": "NIFTY 50", "last": 100, "open": 99}]}
+        with patch("nseapi.fetch_data_from_nse", return_value=data):
+            response = self.client.get("/all-indices?fields=name, last_price")
+        self.assertEqual(response.get_json(), [{"name": "NIFTY 50", "last_price": 100}])
+
+    def test_query_malformed_date_returns_400(self):
+        with patch("nseapi.fetch_data_from_nse", return_value=[]) as mock_fetch:
+            response = self.client.get(
+                "/bulk-deals?from_date=2024/01/05xyz&to_date=2024-01-06"
+            )
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("error", response.get_json())
+        mock_fetch.assert_not_called()
+
+    # Conditional GET
+    def test_matching_etag_returns_304(self):
+        with patch("nseapi.fetch_data_from_nse", return_value={"marketState": "Open"}):
+            first = self.client.get("/market-status")
+            etag = first.headers["ETag"]
+            second = self.client.get("/market-status", headers={"If-None-Match": etag})
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(second.status_code, 304)
+        self.assertEqual(second.get_data(), b"")
+
+    # Batch
+    def test_batch_converts_params_like_query_args(self):
+        chain = {"records": {"data": []}}
+        holidays = {"CM": [{"tradingDate": "26-Jan-2024"}]}
+        with patch(
+            "nseapi.fetch_data_from_nse", return_value=chain
+        ) as mock_fetch, patch(
+            "nseapi._fetch_conditional", return_value=holidays
+        ) as mock_holidays:
+            response = self.client.post(
+                "/batch",
+                json=[
+                    {
+                        "route": "option-chain",
+                        "params": {"symbol": "NIFTY", "is_index": "false"},
+                    },
+                    {"route": "holidays", "params": {"type": "clearing"}},
+                ],
+            )
+        results = response.get_json()
+        self.assertEqual([r["ok"] for r in results], [True, True])
+        self.assertEqual(mock_fetch.call_args[0][0], "option-chain-equities")
+        self.assertEqual(mock_holidays.call_args[1]["params"], {"type": "clearing"})
+
+    def test_batch_bad_items_fail_individually(self):
+        with patch("nseapi.fetch_data_from_nse", return_value={"marketState": "Open"}):
+            response = self.client.post(
+                "/batch",
+                json=[
+                    {"route": "market-status"},
+                    {
+                        "route": "bulk-deals",
+                        "params": {"from_date": "bad", "to_date": "2024-01-06"},
+                    },
+                    "market-status",
+                    {"route": "holidays", "params": {"holiday_type": "trading"}},
+                    {"route": "no-such-route"},
+                ],
+            )
+        self.assertEqual(response.status_code, 200)
+        results = response.get_json()
+        self.assertEqual([r["ok"] for r in results], [True, False, False, False, False])
+        for result in results[1:]:
+            self.assertIn("error", result)
+
+    def test_batch_rejects_non_list_body(self):
+        response = self.client.post("/batch", json={"route": "market-status"})
+        self.assertEqual(response.status_code, 400)
+
+    def test_batch_rejects_too_many_items(self):
+        with patch("nseapi.fetch_data_from_nse") as mock_fetch:
+            response = self.client.post("/batch", json=["market-status"] * 51)
+        self.assertEqual(response.status_code, 400)
+        mock_fetch.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
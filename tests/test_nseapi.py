@@ -1,13 +1,21 @@
+import asyncio
+import io
 import unittest
 from datetime import datetime, timedelta
 import os
+import threading
 import requests
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
+from http.server import BaseHTTPRequestHandler, HTTPServer
 from pathlib import Path
+from urllib3.exceptions import ProtocolError
 import logging
+import nseapi
 from nseapi import (
     get_market_status,
     get_bhavcopy,
+    get_bhavcopies,
+    get_bhavcopy_range,
     get_corporate_actions,
     get_announcements,
     get_stock_quote,
@@ -15,6 +23,10 @@ from nseapi import (
     get_all_indices,
     get_holidays,
     bulk_deals,
+    abulk_deals,
+    aget_stock_quotes,
+    afetch_many,
+    get_stock_quotes,
     get_fii_dii_data,
     get_top_gainers,
     get_top_losers,
@@ -37,6 +49,9 @@ from nseapi import (
     get_unchanged_data,
     get_stocks_traded,
     get_stocks_traded_by_symbol,
+    clear_cache,
+    pop_cache_status,
+    NSEAPIError,
 )
 
 
@@ -44,6 +59,7 @@ class TestNSEAPI(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures before each test method."""
+        clear_cache()
         self.test_dir = os.path.join(os.getcwd(), "test_downloads")
         if not os.path.exists(self.test_dir):
             os.makedirs(self.test_dir)
@@ -67,6 +83,39 @@ class TestNSEAPI(unittest.TestCase):
             self.assertIsInstance(response, dict)
             self.assertIn("marketState", response)
 
+    def test_get_market_status_memoized(self):
+        with self.mock_fetch_data({"marketState": "Open"}) as mock:
+            get_market_status()
+            get_market_status()
+            self.assertEqual(mock.call_count, 1)
+
+    def test_memoized_result_is_copied_and_reports_hit(self):
+        with self.mock_fetch_data({"marketState": "Open"}):
+            get_market_status()["marketState"] = "Closed"
+            pop_cache_status()
+            self.assertEqual(get_market_status(), {"marketState": "Open"})
+            self.assertEqual(pop_cache_status(), "HIT")
+
+    def test_memoize_evicts_least_recently_used(self):
+        calls = []
+
+        @nseapi._memoize(ttl=60.0, maxsize=2)
+        def lookup(symbol):
+            calls.append(symbol)
+            return symbol
+
+        for symbol in ["A", "B", "A", "C", "A", "B"]:
+            lookup(symbol)
+        # B was evicted when C arrived, A stayed because it was used last
+        self.assertEqual(calls, ["A", "B", "C", "B"])
+
+    def test_get_market_status_error_keeps_cause(self):
+        error = requests.exceptions.ConnectionError("connection reset")
+        with patch("nseapi.fetch_data_from_nse", side_effect=error):
+            with self.assertRaises(NSEAPIError) as context:
+                get_market_status()
+            self.assertIs(context.exception.__cause__, error)
+
     # Bhavcopy Tests
     def test_get_bhavcopy_equity(self):
         date = datetime(2023, 12, 26)
@@ -124,6 +173,65 @@ class TestNSEAPI(unittest.TestCase):
 
             self.assertGreater(os.path.getsize(file_path), 0)
 
+    def test_get_bhavcopy_uses_existing_file(self):
+        date = datetime(2023, 12, 26)
+        existing = Path(self.test_dir) / "delivery_bhavcopy_20231226.csv"
+        existing.write_bytes(b"mock_data")
+        with patch("nseapi.session.get") as mock_get:
+            file_path = get_bhavcopy("delivery", date, download_dir=self.test_dir)
+            mock_get.assert_not_called()
+        self.assertEqual(file_path, existing)
+
+    def test_get_bhavcopy_streams_csv_and_closes_response(self):
+        date = datetime(2023, 12, 26)
+        with patch("nseapi._fetch_cookies"), patch("nseapi.session.get") as mock_get:
+            response = mock_get.return_value.__enter__.return_value
+            response.raw = io.BytesIO(b"SYMBOL,CLOSE\nINFY,1500\n")
+            file_path = get_bhavcopy("delivery", date, download_dir=self.test_dir)
+            mock_get.return_value.__exit__.assert_called_once()
+        self.assertEqual(file_path.read_bytes(), b"SYMBOL,CLOSE\nINFY,1500\n")
+
+    def test_get_bhavcopy_truncated_body_raises_and_cleans_up(self):
+        date = datetime(2023, 12, 26)
+        with patch("nseapi._fetch_cookies"), patch("nseapi.session.get") as mock_get:
+            response = mock_get.return_value.__enter__.return_value
+            response.raw.read.side_effect = [
+                b"SYMBOL,CLOSE\n",
+                ProtocolError("Connection broken: IncompleteRead"),
+            ]
+            with self.assertRaises(FileNotFoundError):
+                get_bhavcopy("delivery", date, download_dir=self.test_dir)
+        self.assertEqual(os.listdir(self.test_dir), [])
+
+    def test_get_bhavcopies_keeps_date_order(self):
+        dates = [datetime(2023, 12, 26), datetime(2023, 12, 27)]
+        for day in dates:
+            existing = Path(self.test_dir) / f"delivery_bhavcopy_{day:%Y%m%d}.csv"
+            existing.write_bytes(b"mock_data")
+        with patch("nseapi.session.get") as mock_get:
+            paths = get_bhavcopies("delivery", dates, download_dir=self.test_dir)
+            mock_get.assert_not_called()
+        self.assertEqual(
+            [path.name for path in paths],
+            ["delivery_bhavcopy_20231226.csv", "delivery_bhavcopy_20231227.csv"],
+        )
+
+    def test_get_bhavcopy_range_skips_weekends_and_missing_days(self):
+        missing = requests.exceptions.HTTPError(response=MagicMock(status_code=404))
+
+        def fake_bhavcopy(bhavcopy_type, day, download_dir, overwrite):
+            if day.day == 26:
+                raise FileNotFoundError("not published") from missing
+            return Path(download_dir) / f"{day:%Y%m%d}.csv"
+
+        with patch("nseapi.get_bhavcopy", side_effect=fake_bhavcopy) as mock_get:
+            paths = get_bhavcopy_range(
+                "equity", datetime(2024, 1, 26), datetime(2024, 1, 29), self.test_dir
+            )
+        # 27th/28th are a weekend, the 26th (Republic Day) has no report
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual([path.name for path in paths], ["20240129.csv"])
+
     def test_get_bhavcopy_invalid_type(self):
 
         date = datetime(2023, 12, 26)
@@ -175,6 +283,14 @@ class TestNSEAPI(unittest.TestCase):
             )
             self.assertIsInstance(announcements, list)
 
+    def test_get_announcements_fno_params(self):
+        with self.mock_fetch_data([]) as mock_fetch:
+            get_announcements(index="equities", fno=True)
+        mock_fetch.assert_called_once_with(
+            "corporate-announcements",
+            params={"index": "equities", "fo_sec": "true"},
+        )
+
     # Stock Quotes
     def test_get_stock_quote(self):
         with self.mock_fetch_data(
@@ -184,13 +300,64 @@ class TestNSEAPI(unittest.TestCase):
             self.assertIsInstance(quote, dict)
             self.assertEqual(quote["symbol"], "INFY")
 
+    def test_get_stock_quote_bypasses_response_cache(self):
+        with self.mock_fetch_data(
+            {"info": {"symbol": "INFY"}, "priceInfo": {"lastPrice": 1500}}
+        ) as mock_fetch:
+            get_stock_quote("INFY")
+            get_stock_quote("INFY")
+        # The 5 s memo is the only cache, so quotes are never older than 5 s
+        mock_fetch.assert_called_once_with(
+            "quote-equity", params={"symbol": "INFY"}, ttl=0
+        )
+
+    def test_memoized_symbol_lookups_share_normalized_entry(self):
+        with self.mock_fetch_data(
+            {"info": {"symbol": "INFY"}, "records": {"data": []}}
+        ) as mock_fetch:
+            get_stock_quote("infy")
+            get_stock_quote(" INFY ")
+            get_option_chain("nifty", is_index=True)
+            get_option_chain("NIFTY", True)
+        self.assertEqual(mock_fetch.call_count, 2)
+
     def test_get_stock_quote_invalid_symbol(self):
         with self.mock_fetch_data(None):
             with self.assertRaises(ValueError) as context:
                 get_stock_quote("INVALID_SYMBOL")
             self.assertIn("Invalid symbol", str(context.exception))
 
+    def test_get_stock_quote_unknown_symbol_404(self):
+        # A 404 Response is falsy, so the handler must not test its truthiness
+        not_found = requests.Response()
+        not_found.status_code = 404
+        error = requests.exceptions.HTTPError(response=not_found)
+        with patch("nseapi.fetch_data_from_nse", side_effect=error):
+            with self.assertRaises(ValueError):
+                get_stock_quote("NOPE")
+            with self.assertRaises(ValueError):
+                get_option_chain("NOPE")
+
     # Option Chain
+    def test_aget_stock_quotes_keeps_symbol_order(self):
+        def fake_quote(symbol):
+            return {"symbol": symbol}
+
+        with patch("nseapi.get_stock_quote", side_effect=fake_quote):
+            quotes = asyncio.run(aget_stock_quotes(["INFY", "TCS", "SBIN"]))
+        self.assertEqual([q["symbol"] for q in quotes], ["INFY", "TCS", "SBIN"])
+
+    def test_get_stock_quotes_keeps_symbol_order(self):
+        with patch("nseapi.get_stock_quote", side_effect=lambda s: {"symbol": s}):
+            quotes = get_stock_quotes(["INFY", "TCS", "SBIN"])
+        self.assertEqual([q["symbol"] for q in quotes], ["INFY", "TCS", "SBIN"])
+
+    def test_get_stock_quote_rejects_malformed_symbol(self):
+        with self.mock_fetch_data({}) as mock:
+            with self.assertRaises(ValueError):
+                get_stock_quote("INFY&symbol=TCS ")
+            mock.assert_not_called()
+
     def test_get_option_chain(self):
         with self.mock_fetch_data({"records": {"data": []}}):
             option_chain = get_option_chain("RELIANCE")
@@ -219,10 +386,33 @@ class TestNSEAPI(unittest.TestCase):
             if indices:
                 self.assertIn("name", indices[0])
 
+    def test_get_all_indices_fields_and_raw(self):
+        row = {"index": "NIFTY 50", "last": 18000, "variation": 10}
+        with self.mock_fetch_data({"data": [row]}):
+            self.assertEqual(
+                get_all_indices(fields=["name", "last_price"]),
+                [{"name": "NIFTY 50", "last_price": 18000}],
+            )
+            self.assertEqual(get_all_indices(raw=True), [row])
+            with self.assertRaises(ValueError):
+                get_all_indices(fields=["bogus"])
+
+    def test_get_all_indices_shares_one_cache_layer(self):
+        row = {"index": "NIFTY 50", "last": 18000}
+        with self.mock_fetch_data({"data": [row]}) as mock_fetch:
+            get_all_indices()
+            get_all_indices(fields=["name"])
+            get_all_indices(raw=True)
+        # One memoized fetch serves every projection, bypassing the response cache
+        mock_fetch.assert_called_once_with("allIndices", ttl=0)
+
     # Holidays
     def test_get_holidays_trading(self):
-        with self.mock_fetch_data(
-            {"CD": [{"tradingDate": "26-Jan-2025", "description": "Republic Day"}]}
+        with patch(
+            "nseapi._fetch_conditional",
+            return_value={
+                "CD": [{"tradingDate": "26-Jan-2025", "description": "Republic Day"}]
+            },
         ):
             holidays = get_holidays(holiday_type="trading")
 
@@ -230,20 +420,54 @@ class TestNSEAPI(unittest.TestCase):
 
     def test_get_holidays_clearing(self):
 
-        with self.mock_fetch_data(
-            {
+        with patch(
+            "nseapi._fetch_conditional",
+            return_value={
                 "CD": [
                     {
                         "tradingDate": "19-Feb-2025",
                         "description": "Chhatrapati Shivaji Maharaj Jayanti",
                     }
                 ]
-            }
+            },
         ):
             holidays = get_holidays(holiday_type="clearing")
 
             self.assertIn("CD", holidays)
 
+    def test_get_holidays_revalidates_with_etag(self):
+        first = MagicMock(status_code=200, headers={"ETag": 'W/"abc"'})
+        first.content = b'{"CD": []}'
+        first.json.return_value = {"CD": []}
+        not_modified = MagicMock(status_code=304, headers={})
+        with patch("nseapi._fetch_cookies"), patch(
+            "nseapi.session.get", side_effect=[first, not_modified]
+        ) as mock_get:
+            self.assertEqual(get_holidays(), {"CD": []})
+            # Bypass the memoized result to force a second request
+            self.assertEqual(get_holidays.__wrapped__(), {"CD": []})
+            self.assertEqual(
+                mock_get.call_args.kwargs["headers"], {"If-None-Match": 'W/"abc"'}
+            )
+
+    def test_get_holidays_revalidation_retries_and_copies(self):
+        first = MagicMock(status_code=200, headers={"ETag": 'W/"abc"'})
+        first.content = b'{"CD": []}'
+        first.json.return_value = {"CD": []}
+        unavailable = MagicMock(status_code=503, headers={})
+        unavailable.raise_for_status.side_effect = requests.HTTPError(
+            response=unavailable
+        )
+        not_modified = MagicMock(status_code=304, headers={})
+        with patch("nseapi._fetch_cookies"), patch(
+            "nseapi._retry_delay", return_value=0
+        ), patch(
+            "nseapi.session.get", side_effect=[first, unavailable, not_modified]
+        ) as mock_get:
+            get_holidays.__wrapped__()["CD"].append("mutated")
+            self.assertEqual(get_holidays.__wrapped__(), {"CD": []})
+            self.assertEqual(mock_get.call_count, 3)
+
     # Bulk Deals
     def test_bulk_deals(self):
         from_date = datetime(2023, 1, 1)
@@ -253,6 +477,13 @@ class TestNSEAPI(unittest.TestCase):
             bulk_deals_data = bulk_deals(from_date, to_date)
             self.assertIsInstance(bulk_deals_data, list)
 
+    def test_abulk_deals(self):
+        from_date = datetime(2023, 1, 1)
+        to_date = datetime(2023, 12, 31)
+        with self.mock_fetch_data([{"symbol": "RELIANCE", "quantity": 1000}]):
+            bulk_deals_data = asyncio.run(abulk_deals(from_date, to_date))
+            self.assertEqual(bulk_deals_data[0]["symbol"], "RELIANCE")
+
     # FII/DII Data
     def test_get_fii_dii_data(self):
         with self.mock_fetch_data([{"category": "FII/FPI", "netValue": "-1491.46"}]):
@@ -613,6 +844,169 @@ class TestNSEAPI(unittest.TestCase):
                 get_stocks_traded_by_symbol("INVALID_SYMBOL")
             self.assertIn("No data found for symbol", str(context.exception))
 
+    # Response Cache
+    def test_fetch_data_from_nse_cache_hit(self):
+        clear_cache()
+        with patch(
+            "nseapi._fetch_uncached", return_value={"marketState": "Open"}
+        ) as mock:
+            first = fetch_data_from_nse("marketStatus")
+            self.assertEqual(pop_cache_status(), "MISS")
+            second = fetch_data_from_nse("marketStatus")
+            self.assertEqual(pop_cache_status(), "HIT")
+            self.assertEqual(first, second)
+            self.assertEqual(mock.call_count, 1)
+        clear_cache()
+
+    def test_fetch_cookies_reuses_unexpired_nse_cookies(self):
+        expires = int(datetime.now().timestamp()) + 3600
+        try:
+            for name in ("nsit", "nseappid"):
+                nseapi.session.cookies.set(
+                    name, "x", domain=".nseindia.com", expires=expires
+                )
+            with patch("nseapi._cookies_fetched_at", 0.0), patch(
+                "nseapi.session.get"
+            ) as mock_get:
+                nseapi._fetch_cookies()
+                mock_get.assert_not_called()
+        finally:
+            nseapi.session.cookies.clear()
+
+    def test_afetch_many_keeps_spec_order(self):
+        def fake_fetch(endpoint, params=None):
+            return {"endpoint": endpoint, "params": params}
+
+        with patch("nseapi.fetch_data_from_nse", side_effect=fake_fetch):
+            results = asyncio.run(
+                afetch_many([("allIndices", None), ("marketStatus", {"a": 1})])
+            )
+        self.assertEqual(
+            results,
+            [
+                {"endpoint": "allIndices", "params": None},
+                {"endpoint": "marketStatus", "params": {"a": 1}},
+            ],
+        )
+
+    def test_file_cache_round_trip(self):
+        cache = nseapi.FileCache(self.test_dir)
+        cache.set("allIndices", {"data": [1, 2]}, ttl=60)
+        fresh_until, value = nseapi.FileCache(self.test_dir).get("allIndices")
+        self.assertEqual(value, {"data": [1, 2]})
+        self.assertIsNone(cache.get("marketStatus"))
+        cache.clear()
+        self.assertIsNone(cache.get("allIndices"))
+
+    def test_file_cache_removes_expired_entries(self):
+        cache = nseapi.FileCache(self.test_dir, sweep_interval=0)
+        with patch("nseapi.time", return_value=1000.0):
+            cache.set("allIndices", {"data": []}, ttl=5)
+            cache.set("marketStatus", {"data": []}, ttl=5)
+        self.assertEqual(len(os.listdir(self.test_dir)), 2)
+        # Reading an expired entry deletes it; the next write sweeps the rest
+        self.assertIsNone(cache.get("allIndices"))
+        self.assertEqual(len(os.listdir(self.test_dir)), 1)
+        cache.set("holiday-master", {"data": []}, ttl=60)
+        self.assertEqual(len(os.listdir(self.test_dir)), 1)
+        self.assertEqual((cache.hits, cache.misses), (0, 1))
+
+    def test_fetch_data_from_nse_coalesces_concurrent_misses(self):
+        followers = threading.Semaphore(0)
+
+        class CountingFuture(nseapi.Future):
+            def result(self, timeout=None):
+                # A follower holds the leader's future from here on
+                followers.release()
+                return super().result(timeout)
+
+        def slow_fetch(*args):
+            # Hold the leader's request until every other thread is waiting on it
+            for _ in range(3):
+                self.assertTrue(followers.acquire(timeout=5))
+            return {"ok": True}
+
+        results = []
+
+        def fetch():
+            # ttl=0 bypasses the response cache, so only coalescing can help
+            results.append(fetch_data_from_nse("allIndices", ttl=0))
+
+        with patch("nseapi.Future", CountingFuture), patch(
+            "nseapi._fetch_uncached", side_effect=slow_fetch
+        ) as mock_fetch:
+            threads = [threading.Thread(target=fetch) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual(results, [{"ok": True}] * 4)
+        self.assertEqual(mock_fetch.call_count, 1)
+
+    def test_fetch_data_from_nse_cached_result_is_copied(self):
+        with patch("nseapi._fetch_uncached", return_value={"data": []}):
+            fetch_data_from_nse("allIndices")["data"].append("mutated")
+            self.assertEqual(fetch_data_from_nse("allIndices"), {"data": []})
+
+    def test_fetch_data_from_nse_honours_retry_after(self):
+        throttled = MagicMock()
+        throttled.raise_for_status.side_effect = requests.exceptions.HTTPError(
+            response=MagicMock(headers={"Retry-After": "2"})
+        )
+        ok = MagicMock(content=b'{"ok": true}')
+        ok.json.return_value = {"ok": True}
+        with patch("nseapi._fetch_cookies"), patch("nseapi.sleep") as mock_sleep, patch(
+            "nseapi.session.get", side_effect=[throttled, ok]
+        ):
+            self.assertEqual(fetch_data_from_nse("marketStatus", ttl=0), {"ok": True})
+        mock_sleep.assert_called_once_with(2.0)
+
+    def test_fetch_data_from_nse_does_not_retry_404(self):
+        not_found = MagicMock()
+        not_found.raise_for_status.side_effect = requests.exceptions.HTTPError(
+            response=MagicMock(status_code=404, headers={})
+        )
+        with patch("nseapi._fetch_cookies"), patch("nseapi.sleep") as mock_sleep, patch(
+            "nseapi.session.get", return_value=not_found
+        ) as mock_get:
+            with self.assertRaises(requests.exceptions.HTTPError):
+                fetch_data_from_nse("quote-equity", {"symbol": "NOPE"}, ttl=0)
+        self.assertEqual(mock_get.call_count, 1)
+        mock_sleep.assert_not_called()
+
+    def test_session_adapter_does_not_retry_status(self):
+        hits = []
+
+        class Unavailable(BaseHTTPRequestHandler):
+            def do_GET(self):
+                hits.append(self.path)
+                self.send_response(503)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        server = HTTPServer(("127.0.0.1", 0), Unavailable)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            response = nseapi.session.get(f"http://127.0.0.1:{server.server_port}/")
+        finally:
+            server.shutdown()
+            server.server_close()
+        # Retries belong to _fetch_uncached alone
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(len(hits), 1)
+
+    def test_fetch_data_from_nse_cache_disabled(self):
+        clear_cache()
+        with patch(
+            "nseapi._fetch_uncached", return_value={"marketState": "Open"}
+        ) as mock:
+            fetch_data_from_nse("marketStatus", ttl=0)
+            fetch_data_from_nse("marketStatus", ttl=0)
+            self.assertEqual(mock.call_count, 2)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,12 @@
+# wsgi.py
+# gevent must patch sockets before requests is imported
+try:
+    from gevent import monkey
+
+    monkey.patch_all()
+except ImportError:
+    pass
+
+from backend.app import app
+
+application = app